@@ -152,29 +152,34 @@ class AnalyticsService:
                     # Remove temporary apps set
                     cat_stats.pop("apps", None)
 
-            # Calculate productivity trends
-            hourly_trends = [0.0] * 24
-            daily_trends = [0.0] * 7
+            # Calculate productivity trends: sum per bucket in one pass and
+            # average once at the end
+            hourly_sums = [0.0] * 24
+            daily_sums = [0.0] * 7
             hourly_counts = [0] * 24
             daily_counts = [0] * 7
 
             for activity in activity_dicts:
                 start = activity["start_time"]
-                if start and activity["duration"] > 0:
+                duration = activity["duration"]
+                if start and duration > 0:
+                    productivity = activity["active_time"] / duration
                     hour = start.hour
                     day = start.weekday()
-                    productivity = activity["active_time"] / activity["duration"]
-
-                    hourly_trends[hour] = (
-                        (hourly_trends[hour] * hourly_counts[hour]) + productivity
-                    ) / (hourly_counts[hour] + 1)
-                    daily_trends[day] = (
-                        (daily_trends[day] * daily_counts[day]) + productivity
-                    ) / (daily_counts[day] + 1)
-
+                    hourly_sums[hour] += productivity
                     hourly_counts[hour] += 1
+                    daily_sums[day] += productivity
                     daily_counts[day] += 1
 
+            hourly_trends = [
+                total / count if count else 0.0
+                for total, count in zip(hourly_sums, hourly_counts)
+            ]
+            daily_trends = [
+                total / count if count else 0.0
+                for total, count in zip(daily_sums, daily_counts)
+            ]
+
             logger.debug("Successfully generated productivity report")
 
             return {
@@ -20,7 +20,6 @@ from infrastructure.storage.encrypted_json_storage import EncryptedJsonStorage
 from infrastructure.storage.daily_encrypted_json_storage import (
     DailyEncryptedJsonStorage,
 )
-from presentation.ui.dashboard import Dashboard
 from presentation.ui.system_tray import SystemTrayApp
 from presentation.ui.utils.service_connector import ServiceConnector
 from presentation.ui.utils.log_handler import QtLogHandler
@@ -15,6 +15,8 @@ class ActivityTableModel(QAbstractTableModel):
         """Initialize activity table model."""
         super().__init__(parent)
         self.activities = []
+        # Display values laid out per column, so a cell is a list index
+        self._columns: List[List[Any]] = [[] for _ in range(6)]
         self._sort_column = -1
         self._sort_order = Qt.SortOrder.AscendingOrder
         self.headers = [
@@ -50,23 +52,7 @@ class ActivityTableModel(QAbstractTableModel):
                 return None
 
             if role == Qt.ItemDataRole.DisplayRole:
-                activity = self.activities[index.row()]
-                column = index.column()
-
-                if column == 0:  # Time
-                    return activity.get("start_time", "")
-                elif column == 1:  # Application
-                    return activity.get("app_name", "Unknown")
-                elif column == 2:  # Window Title
-                    return activity.get("window_title", "")
-                elif column == 3:  # Duration
-                    return activity.get("duration", "0s")
-                elif column == 4:  # Active Time
-                    return activity.get("active_time", "0s")
-                elif column == 5:  # Status
-                    active_time = activity.get("active_time", "0s")
-                    idle_time = activity.get("idle_time", "0s")
-                    return "Active" if active_time > idle_time else "Idle"
+                return self._columns[index.column()][index.row()]
 
             elif role == Qt.ItemDataRole.TextAlignmentRole:
                 column = index.column()
@@ -101,6 +87,30 @@ class ActivityTableModel(QAbstractTableModel):
 
         return None
 
+    def _set_activities(self, activities: List[Dict[str, Any]]):
+        """Replace the row data and rebuild the display columns."""
+        self.activities = activities
+        self._rebuild_columns()
+
+    def _rebuild_columns(self):
+        """Materialize the display value of every cell, column by column."""
+        activities = self.activities
+        self._columns = [
+            [a.get("start_time", "") for a in activities],  # Time
+            [a.get("app_name", "Unknown") for a in activities],  # Application
+            [a.get("window_title", "") for a in activities],  # Window Title
+            [a.get("duration", "0s") for a in activities],  # Duration
+            [a.get("active_time", "0s") for a in activities],  # Active Time
+            [  # Status
+                (
+                    "Active"
+                    if a.get("active_time", "0s") > a.get("idle_time", "0s")
+                    else "Idle"
+                )
+                for a in activities
+            ],
+        ]
+
     def _parse_time(self, time_str: str) -> datetime:
         """Parse time string to datetime for sorting."""
         try:
@@ -169,6 +179,7 @@ class ActivityTableModel(QAbstractTableModel):
                     reverse=(order == Qt.SortOrder.DescendingOrder),
                 )
 
+            self._rebuild_columns()
             self.layoutChanged.emit()
 
         except Exception as e:
@@ -179,7 +190,7 @@ class ActivityTableModel(QAbstractTableModel):
         try:
             if not activities:
                 self.beginResetModel()
-                self.activities = []
+                self._set_activities([])
                 self.endResetModel()
                 return
 
@@ -189,14 +200,14 @@ class ActivityTableModel(QAbstractTableModel):
 
             if new_count < old_count:
                 self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
-                self.activities = activities
+                self._set_activities(activities)
                 self.endRemoveRows()
             elif new_count > old_count:
                 self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
-                self.activities = activities
+                self._set_activities(activities)
                 self.endInsertRows()
             else:
-                self.activities = activities
+                self._set_activities(activities)
                 self.dataChanged.emit(
                     self.index(0, 0), self.index(new_count - 1, self.columnCount() - 1)
                 )
@@ -209,5 +220,5 @@ class ActivityTableModel(QAbstractTableModel):
             logger.error(f"Error updating activities: {e}", exc_info=True)
             # Fall back to full reset if update fails
             self.beginResetModel()
-            self.activities = activities
+            self._set_activities(activities)
             self.endResetModel()
@@ -160,17 +160,21 @@ class Dashboard(QMainWindow):
             self.statistics = StatisticsLayout()
             self.activity_log = ActivityLogLayout()
             self.system_log = SystemLogLayout()
-            self.workspace = WorkspaceLayout(service_connector=self.service_connector)
-            self.configuration = ConfigurationLayout(
-                service_connector=self.service_connector
-            )
+            # Workspace and Configuration load their own data and get no
+            # dashboard updates, so they are built on first visit
+            self.workspace = None
+            self.configuration = None
+            self._page_builders = {
+                4: self._build_workspace_page,
+                5: self._build_configuration_page,
+            }
 
             self.content_stack.addWidget(self.overview)
             self.content_stack.addWidget(self.statistics)
             self.content_stack.addWidget(self.activity_log)
             self.content_stack.addWidget(self.system_log)
-            self.content_stack.addWidget(self.workspace)
-            self.content_stack.addWidget(self.configuration)
+            self.content_stack.addWidget(QWidget())  # Workspace placeholder
+            self.content_stack.addWidget(QWidget())  # Configuration placeholder
 
             # Assemble body and main layout
             body.addWidget(self.side_panel)
@@ -193,11 +197,14 @@ class Dashboard(QMainWindow):
 
             # Setup update timer
             self.update_timer = QTimer(self)
+            # Second-level accuracy is plenty for a 30s refresh and lets the
+            # OS coalesce the wakeup with others
+            self.update_timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
             self.update_timer.timeout.connect(self._update_data)
-            self.update_timer.start(30000)  # Update every 30 seconds
-
-            # Initial update
-            self._update_data()
+            # Update every 30 seconds; only runs while the window is shown
+            self.update_timer.setInterval(30000)
+            # Nothing loaded yet; the first show fetches data after painting
+            self._data_stale = True
 
             # Set initial page
             overview_btn.setChecked(True)
@@ -222,9 +229,38 @@ class Dashboard(QMainWindow):
             logger.error(f"Error creating nav button: {e}", exc_info=True)
             raise
 
+    def _build_workspace_page(self) -> QWidget:
+        """Create the workspace page."""
+        self.workspace = WorkspaceLayout(service_connector=self.service_connector)
+        return self.workspace
+
+    def _build_configuration_page(self) -> QWidget:
+        """Create the configuration page."""
+        self.configuration = ConfigurationLayout(
+            service_connector=self.service_connector
+        )
+        return self.configuration
+
+    def _ensure_page(self, index: int):
+        """Replace a placeholder page with the real page on first visit."""
+        builder = self._page_builders.get(index)
+        if builder is None:
+            return
+        # Build before forgetting the builder, so a failed build is retried
+        # on the next visit
+        page = builder()
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, page)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        del self._page_builders[index]
+        logger.debug(f"Built dashboard page {index} on first use")
+
     def _switch_page(self, index: int):
         """Switch to page at index."""
         try:
+            self._ensure_page(index)
+
             # Update button states
             for i, button in enumerate(self.nav_buttons):
                 button.setChecked(i == index)
@@ -269,29 +305,23 @@ class Dashboard(QMainWindow):
                     self.activity_log.update_data(data["activities"].get("list", []))
 
                 # Update overview with productivity metrics and trends
-                if "productivity" in data:
-                    productivity = data["productivity"]
+                productivity = data.get("productivity")
+                if productivity is not None:
+                    metrics = productivity.get("metrics") or {}
+                    trends = productivity.get("trends") or {}
                     overview_payload = {
                         # Time metrics
-                        "total_time": productivity["metrics"].get("total_time", 0),
-                        "active_time": productivity["metrics"].get("active_time", 0),
-                        "idle_time": productivity["metrics"].get("idle_time", 0),
-                        "focus_time": productivity["metrics"].get("focus_time", 0),
-                        "break_time": productivity["metrics"].get("break_time", 0),
+                        "total_time": metrics.get("total_time", 0),
+                        "active_time": metrics.get("active_time", 0),
+                        "idle_time": metrics.get("idle_time", 0),
+                        "focus_time": metrics.get("focus_time", 0),
+                        "break_time": metrics.get("break_time", 0),
                         # Performance metrics
-                        "productivity_score": productivity["metrics"].get(
-                            "productivity_score", 0
-                        ),
-                        "efficiency_score": productivity["metrics"].get(
-                            "efficiency_score", 0
-                        ),
-                        "avg_session_time": productivity["metrics"].get(
-                            "avg_session_time", 0
-                        ),
+                        "productivity_score": metrics.get("productivity_score", 0),
+                        "efficiency_score": metrics.get("efficiency_score", 0),
+                        "avg_session_time": metrics.get("avg_session_time", 0),
                         # Trends and distribution
-                        "productivity_trends": productivity["trends"].get(
-                            "productivity_trends", {}
-                        ),
+                        "productivity_trends": trends.get("productivity_trends", {}),
                         "hourly_distribution": productivity.get(
                             "hourly_distribution", {}
                         ),
@@ -300,10 +330,8 @@ class Dashboard(QMainWindow):
                         overview_payload["suggestions"] = data.get("suggestions", [])
                     self.overview.update_data(overview_payload)
 
-                # Update statistics with app and category data
-                if "productivity" in data:
-                    productivity = data["productivity"]
-                    statistics = productivity.get("statistics", {})
+                    # Update statistics with app and category data
+                    statistics = productivity.get("statistics") or {}
                     self.statistics.update_data(
                         {
                             "app_data": statistics.get("app_data", []),
@@ -326,12 +354,39 @@ class Dashboard(QMainWindow):
             # Find Qt log handler
             for handler in logging.getLogger().handlers:
                 if isinstance(handler, QtLogHandler):
-                    handler.connect_to_widget(self.system_log.handle_log_message)
+                    # The slot only enqueues under a lock, so call it in the
+                    # logging thread rather than posting an event per record
+                    handler.connect_to_widget(
+                        self.system_log.handle_log_message,
+                        Qt.ConnectionType.DirectConnection,
+                    )
                     logger.debug("Connected Qt log handler to system log layout")
                     break
         except Exception as e:
             logger.error(f"Error connecting log handler: {e}", exc_info=True)
 
+    def showEvent(self, event):
+        """Resume periodic updates when the window is shown."""
+        super().showEvent(event)
+        try:
+            if not self.update_timer.isActive():
+                if self._data_stale:
+                    # Let the window paint before the service round trip
+                    QTimer.singleShot(0, self._update_data)
+                    self._data_stale = False
+                self.update_timer.start()
+        except Exception as e:
+            logger.error(f"Error handling show event: {e}", exc_info=True)
+
+    def hideEvent(self, event):
+        """Pause periodic updates while the window is hidden."""
+        super().hideEvent(event)
+        try:
+            self.update_timer.stop()
+            self._data_stale = True
+        except Exception as e:
+            logger.error(f"Error handling hide event: {e}", exc_info=True)
+
     def closeEvent(self, event):
         """Handle window close event."""
         try:
@@ -344,6 +399,12 @@ class Dashboard(QMainWindow):
                     handler.disconnect_from_widget(self.system_log.handle_log_message)
                     break
 
+            # Join the log worker before the window is deleted
+            self.system_log.stop_batch_processing()
+
+            # Release the data access worker threads
+            self.service_connector.close()
+
             event.accept()
 
         except Exception as e:
@@ -14,20 +14,27 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from ..utils.config_store import ConfigStore, AppMapping, DEFAULT_CATEGORIES
 from datetime import timedelta
 
 
 class ConfigurationLayout(QWidget):
+    # Last computed (unmapped, uncategorized) tables, shared across instances
+    _cached_unknowns = None
+
     def __init__(self, service_connector, parent=None):
         super().__init__(parent)
         self.service_connector = service_connector
         self.config = ConfigStore()
         self._init_ui()
         self._load_data()
-        self._refresh_unknowns()
+        # Show the last known unknowns right away, then refresh once the
+        # page has painted (the refresh pulls 30 days of activity data)
+        if ConfigurationLayout._cached_unknowns is not None:
+            self._populate_unknowns(*ConfigurationLayout._cached_unknowns)
+        QTimer.singleShot(0, self._refresh_unknowns)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -243,14 +250,6 @@ class ConfigurationLayout(QWidget):
             s["count"] += 1
             last = a.get("start_time") or "N/A"
             s["last"] = max(s["last"], last) if isinstance(s["last"], str) else last
-        # Fill table
-        self.unknown_apps_table.setRowCount(0)
-        for exe, s in sorted(stats.items(), key=lambda x: x[1]["count"], reverse=True):
-            r = self.unknown_apps_table.rowCount()
-            self.unknown_apps_table.insertRow(r)
-            self.unknown_apps_table.setItem(r, 0, QTableWidgetItem(exe))
-            self.unknown_apps_table.setItem(r, 1, QTableWidgetItem(str(s["count"])))
-            self.unknown_apps_table.setItem(r, 2, QTableWidgetItem(str(s["last"])))
         # Uncategorized apps (category == Unknown)
         by_app = {}
         for a in activities:
@@ -259,6 +258,18 @@ class ConfigurationLayout(QWidget):
             if category != "Unknown":
                 continue
             by_app[name] = by_app.get(name, 0) + 1
+        ConfigurationLayout._cached_unknowns = (stats, by_app)
+        self._populate_unknowns(stats, by_app)
+
+    def _populate_unknowns(self, stats: dict, by_app: dict):
+        """Fill the unmapped and uncategorized tables."""
+        self.unknown_apps_table.setRowCount(0)
+        for exe, s in sorted(stats.items(), key=lambda x: x[1]["count"], reverse=True):
+            r = self.unknown_apps_table.rowCount()
+            self.unknown_apps_table.insertRow(r)
+            self.unknown_apps_table.setItem(r, 0, QTableWidgetItem(exe))
+            self.unknown_apps_table.setItem(r, 1, QTableWidgetItem(str(s["count"])))
+            self.unknown_apps_table.setItem(r, 2, QTableWidgetItem(str(s["last"])))
         self.unknown_cats_table.setRowCount(0)
         for name, cnt in sorted(by_app.items(), key=lambda x: x[1], reverse=True):
             r = self.unknown_cats_table.rowCount()
@@ -11,10 +11,12 @@ from PySide6.QtWidgets import (
     QPushButton,
     QApplication,
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QTextCharFormat, QColor, QTextCursor
+from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal, Slot
+from PySide6.QtGui import QTextCursor
+import html
 import logging
 from collections import deque
+from itertools import islice
 from threading import Lock
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,120 @@ MAX_LOG_ENTRIES = 10000  # Maximum number of log entries to store
 BATCH_SIZE = 100  # Number of logs to process in one batch
 BATCH_UPDATE_INTERVAL = 100  # Milliseconds between batch updates
 
+# Colors for each log level
+LEVEL_COLORS = {
+    logging.DEBUG: "#757575",  # Gray
+    logging.INFO: "#FFFFFF",  # White
+    logging.WARNING: "#FFA726",  # Orange
+    logging.ERROR: "#EF5350",  # Red
+    logging.CRITICAL: "#D32F2F",  # Dark Red
+}
+
+# Opening HTML tag per log level, built once at import
+_LEVEL_HTML_PREFIXES = {
+    level: (
+        f'<div style="color:{color};'
+        f'{" font-weight:700;" if level >= logging.CRITICAL else ""}'
+        ' white-space:pre">'
+    )
+    for level, color in LEVEL_COLORS.items()
+}
+
+
+def format_log_html(message: str, level: int) -> str:
+    """Format a log message as a colored HTML block.
+
+    Args:
+        message: Log message text
+        level: Log level (e.g., logging.INFO)
+
+    Returns:
+        HTML fragment rendering the message on its own line
+    """
+    prefix = _LEVEL_HTML_PREFIXES.get(level, _LEVEL_HTML_PREFIXES[logging.INFO])
+    return f"{prefix}{html.escape(message)}</div>"
+
+
+class LogFormatterWorker(QObject):
+    """Drains pending log messages and formats them off the UI thread."""
+
+    # (entries, html, min_level) - the drained (level, html) entries, the
+    # HTML for those passing the filter and the filter level that was applied
+    blockReady = Signal(list, str, int)
+    # Emitted when the queue becomes non-empty; arms the drain timer in the
+    # worker thread so an idle log costs no wakeups
+    _wake = Signal()
+
+    def __init__(self):
+        """Initialize log formatter worker."""
+        super().__init__()
+        self.pending_logs = deque()
+        self.log_lock = Lock()
+        self.min_level = logging.NOTSET
+        self.timer = None
+        self._wake.connect(self._arm)
+
+    def enqueue(self, message: str, level: int):
+        """Queue a log message for formatting.
+
+        Args:
+            message: Log message text
+            level: Log level (e.g., logging.INFO)
+        """
+        with self.log_lock:
+            was_empty = not self.pending_logs
+            self.pending_logs.append((message, level))
+        if was_empty:
+            self._wake.emit()
+
+    def clear(self):
+        """Drop all pending log messages."""
+        with self.log_lock:
+            self.pending_logs.clear()
+
+    @Slot()
+    def start(self):
+        """Start the drain timer in the worker thread."""
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(BATCH_UPDATE_INTERVAL)
+        self.timer.timeout.connect(self.process_pending_logs)
+        self._arm()
+
+    @Slot()
+    def _arm(self):
+        """Schedule a drain if messages are pending and none is scheduled."""
+        if self.timer is None or self.timer.isActive():
+            return
+        with self.log_lock:
+            has_pending = bool(self.pending_logs)
+        if has_pending:
+            self.timer.start()
+
+    @Slot()
+    def process_pending_logs(self):
+        """Format up to BATCH_SIZE pending logs and hand them to the UI."""
+        try:
+            with self.log_lock:
+                pending = self.pending_logs
+                batch = list(
+                    islice(iter(pending.popleft, None), min(len(pending), BATCH_SIZE))
+                )
+            if not batch:
+                return
+
+            entries = [
+                (level, format_log_html(message, level)) for message, level in batch
+            ]
+            min_level = self.min_level
+            block = "".join(entry for level, entry in entries if level >= min_level)
+            self.blockReady.emit(entries, block, min_level)
+        except Exception as e:
+            logger.error(f"Error processing pending logs: {e}", exc_info=True)
+        finally:
+            # Keep draining while a backlog remains, otherwise go idle
+            self._arm()
+
 
 class SystemLogLayout(QWidget):
     """System log layout widget."""
@@ -32,10 +148,10 @@ class SystemLogLayout(QWidget):
         """Initialize system log layout."""
         try:
             super().__init__(parent)
-            # Initialize log storage with thread safety
+            # Ring of (level, preformatted html) entries; pending logs live
+            # in the worker
             self.all_logs = deque(maxlen=MAX_LOG_ENTRIES)
-            self.pending_logs = deque()
-            self.log_lock = Lock()
+            self._min_level = logging.NOTSET
 
             # Initialize UI
             self.setup_ui()
@@ -119,143 +235,133 @@ class SystemLogLayout(QWidget):
             """
             )
             self.log_viewer.document().setMaximumBlockCount(MAX_LOG_ENTRIES)
+            # Logs are read-only; don't keep an undo history of every insert
+            self.log_viewer.setUndoRedoEnabled(False)
+            self._cursor = QTextCursor(self.log_viewer.document())
             layout.addWidget(self.log_viewer)
 
-            # Set up text formats for different log levels
-            self.formats = {
-                logging.DEBUG: self._create_format("#757575"),  # Gray
-                logging.INFO: self._create_format("#FFFFFF"),  # White
-                logging.WARNING: self._create_format("#FFA726"),  # Orange
-                logging.ERROR: self._create_format("#EF5350"),  # Red
-                logging.CRITICAL: self._create_format(
-                    "#D32F2F", True
-                ),  # Dark Red, Bold
-            }
-
         except Exception as e:
             logger.error(f"Error setting up system log layout UI: {e}", exc_info=True)
             raise
 
     def setup_batch_processing(self):
-        """Set up batch processing for log updates."""
+        """Set up the worker thread that batches and formats log updates."""
         try:
-            self.update_timer = QTimer(self)
-            self.update_timer.setInterval(BATCH_UPDATE_INTERVAL)
-            self.update_timer.timeout.connect(self._process_pending_logs)
-            self.update_timer.start()
+            self._log_thread = QThread(self)
+            self._log_worker = LogFormatterWorker()
+            self._log_worker.moveToThread(self._log_thread)
+            self._log_thread.started.connect(self._log_worker.start)
+            self._log_thread.finished.connect(self._log_worker.deleteLater)
+            self._log_worker.blockReady.connect(
+                self._append_log_block, Qt.ConnectionType.QueuedConnection
+            )
+            self._log_thread.start()
+
+            # Make sure the thread is joined before the application tears down
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.stop_batch_processing)
         except Exception as e:
             logger.error(f"Error setting up batch processing: {e}", exc_info=True)
 
-    def _create_format(self, color: str, bold: bool = False) -> QTextCharFormat:
-        """Create text format for log level.
-
-        Args:
-            color: Color in hex format
-            bold: Whether to make text bold
-
-        Returns:
-            QTextCharFormat with specified formatting
-        """
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        if bold:
-            fmt.setFontWeight(700)
-        return fmt
+    def stop_batch_processing(self):
+        """Stop the log worker thread."""
+        if self._log_thread.isRunning():
+            self._log_thread.quit()
+            self._log_thread.wait()
 
+    @Slot(str, int)
     def handle_log_message(self, message: str, level: int):
         """Handle incoming log message.
 
+        Thread-safe: may be called directly from the logging thread, the
+        worker queue is the single hand-off to the UI thread.
+
         Args:
             message: Log message text
             level: Log level (e.g., logging.INFO)
         """
-        try:
-            with self.log_lock:
-                self.pending_logs.append((message, level))
-        except Exception as e:
-            print(f"Error handling log message: {e}")
+        self._log_worker.enqueue(message, level)
 
-    def _process_pending_logs(self):
-        """Process pending logs in batches."""
+    @Slot(list, str, int)
+    def _append_log_block(self, entries: list, block: str, min_level: int):
+        """Append a block of formatted logs produced by the worker.
+
+        Args:
+            entries: Drained (level, html) entries
+            block: HTML for the entries visible at ``min_level``
+            min_level: Filter level the worker applied
+        """
         try:
-            with self.log_lock:
-                # Process up to BATCH_SIZE logs
-                for _ in range(min(len(self.pending_logs), BATCH_SIZE)):
-                    message, level = self.pending_logs.popleft()
-                    self.all_logs.append((message, level))
-
-                    # Check if message should be shown based on current filter
-                    if self._should_show_message(level):
-                        cursor = self.log_viewer.textCursor()
-                        cursor.movePosition(QTextCursor.End)
-                        cursor.insertText(
-                            message + "\n",
-                            self.formats.get(level, self.formats[logging.INFO]),
-                        )
-
-                # Auto-scroll if near bottom
-                scrollbar = self.log_viewer.verticalScrollBar()
-                if scrollbar.value() >= scrollbar.maximum() - 50:
-                    scrollbar.setValue(scrollbar.maximum())
+            self.all_logs.extend(entries)
 
-        except Exception as e:
-            print(f"Error processing pending logs: {e}")
+            # The filter changed while the batch was in flight
+            if min_level != self._min_level:
+                min_level = self._min_level
+                block = "".join(entry for level, entry in entries if level >= min_level)
 
-    def _should_show_message(self, level: int) -> bool:
-        """Check if message should be shown based on current filter.
+            if not block:
+                # Nothing visible was inserted; leave the scrollbar alone
+                return
 
-        Args:
-            level: Log level to check
+            # Auto-scroll only if the view was near the bottom before inserting
+            scrollbar = self.log_viewer.verticalScrollBar()
+            max_v = scrollbar.maximum()
+            at_bottom = scrollbar.value() >= max_v - 50
+
+            # One edit block -> one relayout/repaint for the whole batch
+            cursor = self._cursor
+            cursor.beginEditBlock()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            if not self.log_viewer.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(block)
+            cursor.endEditBlock()
+
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
 
-        Returns:
-            True if message should be shown, False otherwise
-        """
-        try:
-            filter_text = self.level_filter.currentText()
-            if filter_text == "All":
-                return True
-            return level >= getattr(logging, filter_text)
         except Exception as e:
-            print(f"Error checking message visibility: {e}")
-            return True
+            logger.error(f"Error appending log block: {e}", exc_info=True)
 
     def _filter_logs(self):
         """Filter log messages based on selected level."""
         try:
-            self.log_viewer.clear()
+            filter_text = self.level_filter.currentText()
+            self._min_level = (
+                logging.NOTSET
+                if filter_text == "All"
+                else getattr(logging, filter_text)
+            )
+            self._log_worker.min_level = self._min_level
 
-            with self.log_lock:
-                for message, level in self.all_logs:
-                    if self._should_show_message(level):
-                        cursor = self.log_viewer.textCursor()
-                        cursor.movePosition(QTextCursor.End)
-                        cursor.insertText(
-                            message + "\n",
-                            self.formats.get(level, self.formats[logging.INFO]),
-                        )
+            # Entries are preformatted, so refiltering is a single join
+            min_level = self._min_level
+            self.log_viewer.setHtml(
+                "".join(entry for level, entry in self.all_logs if level >= min_level)
+            )
 
             # Maintain scroll position at bottom
             scrollbar = self.log_viewer.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
 
         except Exception as e:
-            print(f"Error filtering logs: {e}")
+            logger.error(f"Error filtering logs: {e}", exc_info=True)
 
     def _clear_logs(self):
         """Clear all log messages."""
         try:
-            with self.log_lock:
-                self.all_logs.clear()
-                self.pending_logs.clear()
-                self.log_viewer.clear()
+            self._log_worker.clear()
+            self.all_logs.clear()
+            self.log_viewer.clear()
         except Exception as e:
-            print(f"Error clearing logs: {e}")
+            logger.error(f"Error clearing logs: {e}", exc_info=True)
 
     def closeEvent(self, event):
         """Handle cleanup on close."""
         try:
-            self.update_timer.stop()
+            self.stop_batch_processing()
             super().closeEvent(event)
         except Exception as e:
-            print(f"Error in close event: {e}")
+            logger.error(f"Error in close event: {e}", exc_info=True)
             event.accept()
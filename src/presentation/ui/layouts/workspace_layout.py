@@ -20,13 +20,27 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 from PySide6.QtCore import Qt
-from typing import List
+from operator import itemgetter
+from typing import Dict, List, Tuple
+
+# Sort combo index -> (precomputed sort key getter, reverse)
+_SORT_KEYS = {
+    0: (itemgetter("_k_updated"), True),  # Updated desc
+    1: (itemgetter("_k_name"), False),  # Name A-Z
+    2: (itemgetter("_k_created"), True),  # Created desc
+}
 
 
 class WorkspaceLayout(QWidget):
     def __init__(self, service_connector, parent=None):
         super().__init__(parent)
         self.service_connector = service_connector
+        # Named workspaces from the last load with precomputed sort keys,
+        # partitioned by (favorites only, templates only); filter and sort
+        # changes reuse them instead of refetching
+        self._ws_subsets: Dict[Tuple[bool, bool], List[dict]] = {}
+        # Created on first use and reused so its parsed-file cache stays warm
+        self._workspaces_store = None
         self._init_ui()
         self._load_named_workspaces()
 
@@ -58,9 +72,9 @@ class WorkspaceLayout(QWidget):
         self.filter_templates = QCheckBox("Templates only")
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["Updated (desc)", "Name (A-Z)", "Created (desc)"])
-        self.filter_favorites.stateChanged.connect(self._load_named_workspaces)
-        self.filter_templates.stateChanged.connect(self._load_named_workspaces)
-        self.sort_combo.currentIndexChanged.connect(self._load_named_workspaces)
+        self.filter_favorites.stateChanged.connect(self._refresh_ws_list)
+        self.filter_templates.stateChanged.connect(self._refresh_ws_list)
+        self.sort_combo.currentIndexChanged.connect(self._refresh_ws_list)
         filters_row.addWidget(self.filter_favorites)
         filters_row.addWidget(self.filter_templates)
         filters_row.addStretch()
@@ -160,22 +174,21 @@ class WorkspaceLayout(QWidget):
         layout.addWidget(self.table)
         layout.addStretch()
 
-    def _apply_filters(self, items: List[dict]) -> List[dict]:
-        fav_only = self.filter_favorites.isChecked()
-        tpl_only = self.filter_templates.isChecked()
-        filtered = [
-            it
-            for it in items
-            if (not fav_only or it.get("favorite"))
-            and (not tpl_only or it.get("template"))
-        ]
-        idx = self.sort_combo.currentIndex()
-        if idx == 0:  # Updated desc
-            filtered.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
-        elif idx == 1:  # Name A-Z
-            filtered.sort(key=lambda x: (x.get("name", "") or "").lower())
-        elif idx == 2:  # Created desc
-            filtered.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+    def _store(self):
+        """Return the layout's shared WorkspacesStore."""
+        if self._workspaces_store is None:
+            from ..utils.workspaces_store import WorkspacesStore
+
+            self._workspaces_store = WorkspacesStore()
+        return self._workspaces_store
+
+    def _apply_filters(self) -> List[dict]:
+        key = (self.filter_favorites.isChecked(), self.filter_templates.isChecked())
+        filtered = list(self._ws_subsets.get(key, ()))
+        sort_spec = _SORT_KEYS.get(self.sort_combo.currentIndex())
+        if sort_spec:
+            key, reverse = sort_spec
+            filtered.sort(key=key, reverse=reverse)
         return filtered
 
     def _populate_ws_list(self, recs: List[dict]) -> None:
@@ -192,7 +205,33 @@ class WorkspaceLayout(QWidget):
 
     def _load_named_workspaces(self) -> None:
         items = self.service_connector.named_workspace_list()
-        self._populate_ws_list(self._apply_filters(items))
+        favorites: List[dict] = []
+        templates: List[dict] = []
+        both: List[dict] = []
+        # Precompute sort keys and the filter partitions once per load
+        for it in items:
+            it["_k_updated"] = it.get("updated_at", "")
+            it["_k_name"] = (it.get("name", "") or "").lower()
+            it["_k_created"] = it.get("created_at", "")
+            favorite = bool(it.get("favorite"))
+            template = bool(it.get("template"))
+            if favorite:
+                favorites.append(it)
+            if template:
+                templates.append(it)
+                if favorite:
+                    both.append(it)
+        self._ws_subsets = {
+            (False, False): items,
+            (True, False): favorites,
+            (False, True): templates,
+            (True, True): both,
+        }
+        self._refresh_ws_list()
+
+    def _refresh_ws_list(self) -> None:
+        """Re-filter and re-sort the loaded workspaces into the list."""
+        self._populate_ws_list(self._apply_filters())
 
     def _populate_table(self, rows):
         self.table.setRowCount(len(rows))
@@ -369,10 +408,7 @@ class WorkspaceLayout(QWidget):
                 )
             else:
                 updated_apps.append(app)
-        from ..utils.workspaces_store import WorkspacesStore
-
-        store = WorkspacesStore()
-        store.update(ws_id, apps=updated_apps)
+        self._store().update(ws_id, apps=updated_apps)
         self.status_label.setText(
             "Captured window positions placeholders for selected workspace."
         )
@@ -395,10 +431,7 @@ class WorkspaceLayout(QWidget):
         dlg = AppEditorDialog(rec.get("apps", []), self)
         if dlg.exec() == dlg.DialogCode.Accepted:
             new_apps = dlg.edited_apps()
-            from ..utils.workspaces_store import WorkspacesStore
-
-            store = WorkspacesStore()
-            store.update(ws_id, apps=new_apps)
+            self._store().update(ws_id, apps=new_apps)
             self.status_label.setText("Updated workspace applications.")
             self._load_named_workspaces()
 
@@ -2,16 +2,64 @@
 
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication, QMessageBox, QWidget
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtCore import Qt, QTimer, QObject
+from PySide6.QtCore import Qt, QTimer, QObject, Slot
 import logging
 import sys
 import os
+import time
+from typing import TYPE_CHECKING, Optional
 
-from .dashboard import Dashboard
 from .utils.service_connector import ServiceConnector
 
+if TYPE_CHECKING:
+    from .dashboard import Dashboard
+
 logger = logging.getLogger(__name__)
 
+# Activations closer together than this (seconds) re-use the previous one;
+# a double click also delivers a single-click Trigger first
+ACTIVATION_DEBOUNCE = 0.5
+
+# Tray context menu entries: (label, handler method name)
+_MENU_ACTIONS = (
+    ("Show Dashboard", "_show_dashboard"),
+    ("Quit", "_quit_application"),
+)
+
+# Optional user-supplied tray icon
+_CUSTOM_ICON_PATH = os.path.join("assets", "icons", "tray_icon.png")
+# Pre-rendered copy of the painted fallback icon below
+_FALLBACK_ICON_PATH = os.path.join("assets", "icons", "tray_fallback.png")
+_FALLBACK_ICON: Optional[QIcon] = None
+
+
+def _fallback_icon() -> QIcon:
+    """Return the default tray icon, loading or drawing it on first use.
+
+    The shipped PNG is used when present; the circle is only painted when
+    running from a directory without the assets.
+
+    Returns:
+        A blue circle icon used when no custom or theme icon is available
+    """
+    global _FALLBACK_ICON
+    if _FALLBACK_ICON is not None:
+        return _FALLBACK_ICON
+    if os.path.exists(_FALLBACK_ICON_PATH):
+        _FALLBACK_ICON = QIcon(_FALLBACK_ICON_PATH)
+    else:
+        from PySide6.QtGui import QPixmap, QPainter, QColor
+
+        pixmap = QPixmap(32, 32)
+        pixmap.fill(QColor(0, 0, 0, 0))
+        painter = QPainter(pixmap)
+        painter.setPen(QColor(0, 120, 215))  # Windows blue color
+        painter.setBrush(QColor(0, 120, 215))
+        painter.drawEllipse(4, 4, 24, 24)
+        painter.end()
+        _FALLBACK_ICON = QIcon(pixmap)
+    return _FALLBACK_ICON
+
 
 class SystemTrayApp(QObject):
     """System tray application."""
@@ -28,11 +76,16 @@ class SystemTrayApp(QObject):
             logger.info("Initializing system tray application...")
 
             self.service_connector = service_connector
-            self.dashboard = None
+            self.dashboard: Optional["Dashboard"] = None
+            self._last_activation = 0.0
+            self._tray_menu: Optional[QMenu] = None
             self.setup_ui()
 
-            # Show dashboard after a delay
-            QTimer.singleShot(2000, self._show_dashboard)
+            # Show dashboard after a delay; kept so quitting can cancel it
+            self._startup_timer = QTimer(self)
+            self._startup_timer.setSingleShot(True)
+            self._startup_timer.timeout.connect(self._show_dashboard)
+            self._startup_timer.start(2000)
 
         except Exception as e:
             logger.error(f"Error initializing system tray: {e}", exc_info=True)
@@ -52,57 +105,31 @@ class SystemTrayApp(QObject):
 
             self.tray_icon = QSystemTrayIcon()
 
-            # Set icon with fallback options
-            icon_set = False
+            # Custom icon, then the system theme icon, then the default circle
             try:
-                # Try custom icon
-                icon_path = os.path.join("assets", "icons", "tray_icon.png")
-                if os.path.exists(icon_path):
-                    self.tray_icon.setIcon(QIcon(icon_path))
-                    icon_set = True
-                    logger.info("Using custom icon")
+                if os.path.exists(_CUSTOM_ICON_PATH):
+                    icon = QIcon(_CUSTOM_ICON_PATH)
+                else:
+                    icon = QIcon.fromTheme("computer")
+                    if icon.isNull():
+                        icon = _fallback_icon()
             except Exception as e:
-                logger.warning(f"Error setting custom icon: {e}")
-
-            if not icon_set:
-                try:
-                    # Try system theme icon
-                    theme_icon = QIcon.fromTheme("computer")
-                    if not theme_icon.isNull():
-                        self.tray_icon.setIcon(theme_icon)
-                        icon_set = True
-                        logger.info("Using system theme icon")
-                except Exception as e:
-                    logger.warning(f"Error setting theme icon: {e}")
-
-            if not icon_set:
-                # Create a simple default icon
-                from PySide6.QtGui import QPixmap, QPainter, QColor
-
-                pixmap = QPixmap(32, 32)
-                pixmap.fill(QColor(0, 0, 0, 0))
-                painter = QPainter(pixmap)
-                painter.setPen(QColor(0, 120, 215))  # Windows blue color
-                painter.setBrush(QColor(0, 120, 215))
-                painter.drawEllipse(4, 4, 24, 24)
-                painter.end()
-                self.tray_icon.setIcon(QIcon(pixmap))
-                logger.info("Using fallback icon")
-
-            # Create tray menu
-            tray_menu = QMenu()
-
-            # Add menu items
-            show_action = QAction("Show Dashboard", self)
-            show_action.triggered.connect(self._show_dashboard)
-            tray_menu.addAction(show_action)
-
-            quit_action = QAction("Quit", self)
-            quit_action.triggered.connect(self._quit_application)
-            tray_menu.addAction(quit_action)
+                logger.warning(f"Error resolving tray icon: {e}")
+                icon = _fallback_icon()
+            self.tray_icon.setIcon(icon)
+
+            # Create tray menu once; re-running setup reuses it
+            if self._tray_menu is None:
+                self._tray_menu = QMenu()
+                self._actions = {}
+                for label, handler in _MENU_ACTIONS:
+                    action = QAction(label, self)
+                    action.triggered.connect(getattr(self, handler))
+                    self._tray_menu.addAction(action)
+                    self._actions[label] = action
 
             # Set menu
-            self.tray_icon.setContextMenu(tray_menu)
+            self.tray_icon.setContextMenu(self._tray_menu)
 
             # Connect activation signal (single click)
             self.tray_icon.activated.connect(self._handle_tray_activation)
@@ -125,7 +152,8 @@ class SystemTrayApp(QObject):
             logger.error(f"Error setting up system tray UI: {e}", exc_info=True)
             raise
 
-    def _show_dashboard(self):
+    @Slot()
+    def _show_dashboard(self) -> None:
         """Show the dashboard window."""
         try:
             logger.info("Attempting to show dashboard...")
@@ -133,7 +161,14 @@ class SystemTrayApp(QObject):
             if not self.dashboard:
                 logger.info("Creating new dashboard instance...")
                 try:
+                    # Imported on first use so the tray starts without it
+                    from .dashboard import Dashboard
+
                     self.dashboard = Dashboard(service_connector=self.service_connector)
+                    # Free the window and its widgets once closed; the next
+                    # activation builds a fresh one
+                    self.dashboard.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+                    self.dashboard.destroyed.connect(self._on_dashboard_destroyed)
                     logger.info("Dashboard instance created successfully")
                 except Exception as e:
                     logger.error(
@@ -162,18 +197,30 @@ class SystemTrayApp(QObject):
                 None, "Error", "Failed to open dashboard. Please try again."
             )
 
-    def _handle_tray_activation(self, reason):
+    @Slot()
+    def _on_dashboard_destroyed(self) -> None:
+        """Drop the reference to a dashboard deleted on close."""
+        self.dashboard = None
+
+    @Slot(QSystemTrayIcon.ActivationReason)
+    def _handle_tray_activation(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """Handle tray icon activation."""
         try:
             if reason in [
                 QSystemTrayIcon.ActivationReason.Trigger,  # Single click
                 QSystemTrayIcon.ActivationReason.DoubleClick,  # Double click
             ]:
+                now = time.monotonic()
+                recent = now - self._last_activation < ACTIVATION_DEBOUNCE
+                self._last_activation = now
+                if recent and self.dashboard and self.dashboard.isVisible():
+                    return
                 self._show_dashboard()
         except Exception as e:
             logger.error(f"Error handling tray activation: {e}", exc_info=True)
 
-    def _quit_application(self):
+    @Slot()
+    def _quit_application(self) -> None:
         """Quit the application."""
         try:
             # Ask for confirmation
@@ -188,6 +235,10 @@ class SystemTrayApp(QObject):
             if reply == QMessageBox.StandardButton.Yes:
                 logger.info("User confirmed application exit")
 
+                # Nothing may reopen the dashboard while shutting down
+                self._startup_timer.stop()
+                self.tray_icon.activated.disconnect(self._handle_tray_activation)
+
                 # Close dashboard if open
                 if self.dashboard:
                     try:
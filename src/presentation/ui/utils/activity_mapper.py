@@ -4,13 +4,34 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+import numpy as np
+
 from core.entities.activity import Activity
 
 logger = logging.getLogger(__name__)
 
 
+def _checked(activities: List[Activity]) -> List[Activity]:
+    """Enforce the List[Activity] contract once at the mapper boundary.
+
+    Non-Activity items are dropped with a warning. The check only runs in
+    debug builds; under ``python -O`` callers are trusted.
+    """
+    if not __debug__:
+        return activities
+    valid = [a for a in activities if isinstance(a, Activity)]
+    if len(valid) != len(activities):
+        logger.warning(
+            f"Ignoring {len(activities) - len(valid)} invalid activity entries"
+        )
+    return valid
+
+
 class ActivityMapper:
-    """Maps activity data for UI components."""
+    """Maps activity data for UI components.
+
+    All mappers expect a list of Activity entities.
+    """
 
     @staticmethod
     def map_activity_list(activities: List[Activity]) -> List[Dict[str, Any]]:
@@ -24,20 +45,16 @@ class ActivityMapper:
         """
         try:
             mapped_activities = []
-            for activity in activities:
-                if not isinstance(activity, Activity):
-                    logger.warning(f"Invalid activity type: {type(activity)}")
-                    continue
-
+            for activity in _checked(activities):
+                active_time = activity.active_time
+                idle_time = activity.idle_time
                 mapped_activities.append(
                     {
                         "time": activity.start_time,
                         "app_name": activity.app_name,
                         "window_title": activity.window_title,
-                        "duration": activity.active_time + activity.idle_time,
-                        "status": "Active"
-                        if activity.active_time > activity.idle_time
-                        else "Idle",
+                        "duration": active_time + idle_time,
+                        "status": "Active" if active_time > idle_time else "Idle",
                     }
                 )
             return mapped_activities
@@ -56,38 +73,17 @@ class ActivityMapper:
             Dictionary of activity statistics
         """
         try:
-            app_stats = {}
-            total_time = 0
-
-            for activity in activities:
-                if not isinstance(activity, Activity):
-                    continue
-
-                duration = activity.active_time + activity.idle_time
-                total_time += duration
-
-                if activity.app_name not in app_stats:
-                    app_stats[activity.app_name] = {
-                        "total_time": 0,
-                        "active_time": 0,
-                        "idle_time": 0,
-                    }
-
-                stats = app_stats[activity.app_name]
-                stats["total_time"] += duration
-                stats["active_time"] += activity.active_time
-                stats["idle_time"] += activity.idle_time
-
-            # Calculate percentages
-            if total_time > 0:
-                for stats in app_stats.values():
-                    stats["usage_percentage"] = stats["total_time"] / total_time
-
-            return {
-                "total_time": total_time,
-                "app_stats": app_stats,
-                "app_count": len(app_stats),
-            }
+            activities = _checked(activities)
+            count = len(activities)
+            return _stats_from_columns(
+                [a.app_name for a in activities],
+                np.fromiter(
+                    (a.active_time for a in activities), dtype=np.float64, count=count
+                ),
+                np.fromiter(
+                    (a.idle_time for a in activities), dtype=np.float64, count=count
+                ),
+            )
         except Exception as e:
             logger.error(f"Error mapping activity statistics: {e}", exc_info=True)
             return {"total_time": 0, "app_stats": {}, "app_count": 0}
@@ -103,28 +99,96 @@ class ActivityMapper:
             Dictionary with hourly and daily activity data
         """
         try:
-            hourly_data = [0.0] * 24
-            daily_data = [0.0] * 7
-
-            for activity in activities:
-                if not isinstance(activity, Activity):
-                    continue
-
-                hour = activity.start_time.hour
-                day = activity.start_time.weekday()
-                duration = activity.active_time + activity.idle_time
-
-                hourly_data[hour] += duration
-                daily_data[day] += duration
-
-            # Normalize data
-            max_hourly = max(hourly_data) if hourly_data else 1
-            max_daily = max(daily_data) if daily_data else 1
-
-            hourly_data = [h / max_hourly for h in hourly_data]
-            daily_data = [d / max_daily for d in daily_data]
-
-            return {"hourly": hourly_data, "daily": daily_data}
+            hours = []
+            days = []
+            durations = []
+            for activity in _checked(activities):
+                start_time = activity.start_time
+                hours.append(start_time.hour)
+                days.append(start_time.weekday())
+                durations.append(activity.active_time + activity.idle_time)
+            return _timeline_from_columns(
+                np.array(hours, dtype=np.int8),
+                np.array(days, dtype=np.int8),
+                np.array(durations, dtype=np.float64),
+            )
         except Exception as e:
             logger.error(f"Error mapping activity timeline: {e}", exc_info=True)
             return {"hourly": [0.0] * 24, "daily": [0.0] * 7}
+
+
+def _stats_from_columns(
+    names: List[Optional[str]], active: np.ndarray, idle: np.ndarray
+) -> Dict[str, Any]:
+    """Group per-activity time columns by app.
+
+    Args:
+        names: App name of each activity
+        active: Active seconds of each activity
+        idle: Idle seconds of each activity
+
+    Returns:
+        Dictionary of activity statistics
+    """
+    if not names:
+        return {"total_time": 0, "app_stats": {}, "app_count": 0}
+
+    # Code apps by first appearance with a dict, which (unlike np.unique)
+    # groups any hashable names, None included, then sum each column in one
+    # C pass
+    app_codes: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (app_codes.setdefault(name, len(app_codes)) for name in names),
+        dtype=np.intp,
+        count=len(names),
+    )
+    active_sums = np.bincount(codes, weights=active, minlength=len(app_codes))
+    idle_sums = np.bincount(codes, weights=idle, minlength=len(app_codes))
+    total_sums = active_sums + idle_sums
+    total_time = float(total_sums.sum())
+
+    app_stats = {}
+    for i, app in enumerate(app_codes):
+        stats = {
+            "total_time": float(total_sums[i]),
+            "active_time": float(active_sums[i]),
+            "idle_time": float(idle_sums[i]),
+        }
+        # Calculate percentages
+        if total_time > 0:
+            stats["usage_percentage"] = stats["total_time"] / total_time
+        app_stats[app] = stats
+
+    return {
+        "total_time": total_time,
+        "app_stats": app_stats,
+        "app_count": len(app_stats),
+    }
+
+
+def _timeline_from_columns(
+    hours: np.ndarray, days: np.ndarray, durations: np.ndarray
+) -> Dict[str, List[float]]:
+    """Build normalized hourly and weekday histograms of activity time.
+
+    Args:
+        hours: Start hour of each activity
+        days: Start weekday of each activity
+        durations: Total seconds of each activity
+
+    Returns:
+        Dictionary with hourly and daily activity data
+    """
+    # bincount yields ints for empty input, so force float for the divide
+    hourly = np.bincount(hours, weights=durations, minlength=24).astype(
+        np.float64, copy=False
+    )
+    daily = np.bincount(days, weights=durations, minlength=7).astype(
+        np.float64, copy=False
+    )
+
+    # Normalize data
+    hourly /= hourly.max() or 1.0
+    daily /= daily.max() or 1.0
+
+    return {"hourly": hourly.tolist(), "daily": daily.tolist()}
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import logging
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from . import json_io
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_CATEGORIES = [
     "Development",
@@ -17,13 +20,21 @@ DEFAULT_CATEGORIES = [
     "Unknown",
 ]
 
+# First-run file contents, serialized once at import
+_DEFAULT_CATEGORIES_JSON = json_io.dumps({"categories": DEFAULT_CATEGORIES})
+_EMPTY_MAPPINGS_JSON = json_io.dumps({"mappings": []})
+# Shared (read-only) result for a missing mappings file, so callers comparing
+# lookup tables by identity see no change while the file stays absent
+_NO_MAPPINGS = ([], {})
+
 
 def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-@dataclass
-class AppMapping:
+class AppMapping(NamedTuple):
+    # Immutable and slot-sized because loaded instances are shared through
+    # the parsed-file cache; copies and pickles like any tuple
     executable: str
     name: str
     category: str
@@ -41,41 +52,117 @@ class ConfigStore:
 
     def __init__(self, base_dir: str = "data/config") -> None:
         self.base_dir = base_dir
-        _ensure_dir(self.base_dir)
+        # The directory is created on first write, not at construction
+        self._dir_ready = False
         self._categories_path = os.path.join(self.base_dir, "categories.json")
         self._mappings_path = os.path.join(self.base_dir, "app_mappings.json")
+        # File stamp and payload last read from / written to each file, to
+        # skip no-op saves: path -> ((mtime_ns, size), payload)
+        self._persisted: Dict[str, Tuple[Optional[Tuple[int, int]], Dict]] = {}
+        # Parsed contents of each file keyed by path, with the file stamp
+        # they were read at: path -> ((mtime_ns, size), value)
+        self._loaded: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+    def _cached(self, path: str, stamp: Tuple[int, int]) -> Optional[Any]:
+        """Return the parsed contents of path if the file is unchanged."""
+        entry = self._loaded.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def _ensure_base_dir(self) -> None:
+        """Create the config directory before the first write."""
+        if not self._dir_ready:
+            _ensure_dir(self.base_dir)
+            self._dir_ready = True
+
+    def _persist(self, path: str, payload: Dict) -> None:
+        """Write payload to path unless it matches what is already on disk.
+
+        The save is skipped only while the file still carries the stamp it
+        had when the payload was read or written, so external edits and
+        writes by other stores are overwritten.
+        """
+        stamp = json_io.file_stamp(path)
+        if stamp is not None and self._persisted.get(path) == (stamp, payload):
+            return
+        self._ensure_base_dir()
+        json_io.atomic_write(path, json_io.dumps(payload))
+        self._persisted[path] = (json_io.file_stamp(path), payload)
+        self._loaded.pop(path, None)
+
+    def _write_default(self, path: str, data: bytes) -> None:
+        """Write a pre-serialized default document to path."""
+        self._ensure_base_dir()
+        json_io.atomic_write(path, data)
+        self._persisted[path] = (json_io.file_stamp(path), json_io.loads(data))
+        self._loaded.pop(path, None)
+
+    def _try_write_default(self, path: str, data: bytes) -> None:
+        """Write a default document, tolerating an unwritable config dir.
+
+        A failed write leaves the file missing, so it is retried on the
+        next load while callers fall back to the in-memory defaults.
+        """
+        try:
+            self._write_default(path, data)
+        except OSError as e:
+            logger.warning(f"Could not write default config {path}: {e}")
 
     # Categories
     def load_categories(self) -> List[str]:
-        if not os.path.exists(self._categories_path):
-            self.save_categories(DEFAULT_CATEGORIES)
+        stamp = json_io.file_stamp(self._categories_path)
+        if stamp is None:
+            self._try_write_default(self._categories_path, _DEFAULT_CATEGORIES_JSON)
             return list(DEFAULT_CATEGORIES)
+        cached = self._cached(self._categories_path, stamp)
+        if cached is not None:
+            return list(cached)
         try:
-            with open(self._categories_path, "r", encoding="utf-8") as f:
-                data = json.load(f) or {}
+            with open(self._categories_path, "rb") as f:
+                data = json_io.loads(f.read()) or {}
+            self._persisted[self._categories_path] = (stamp, data)
             cats = data.get("categories", [])
             if not cats:
                 cats = list(DEFAULT_CATEGORIES)
-                self.save_categories(cats)
-            return cats
+                self._try_write_default(
+                    self._categories_path, _DEFAULT_CATEGORIES_JSON
+                )
+                return cats
+            self._loaded[self._categories_path] = (stamp, cats)
+            return list(cats)
         except Exception:
             return list(DEFAULT_CATEGORIES)
 
     def save_categories(self, categories: List[str]) -> None:
         payload = {"categories": [c for c in categories if c and c.strip()]}
-        with open(self._categories_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        self._persist(self._categories_path, payload)
 
     # App mappings
     def load_mappings(self) -> List[AppMapping]:
-        if not os.path.exists(self._mappings_path):
-            self.save_mappings([])
-            return []
+        return list(self._load_mappings()[0])
+
+    def _load_mappings(
+        self,
+    ) -> Tuple[List[AppMapping], Dict[str, Tuple[str, str]]]:
+        """Return the parsed mappings and their exe_lower lookup table.
+
+        Both are shared with the cache and must not be mutated.
+        """
+        stamp = json_io.file_stamp(self._mappings_path)
+        if stamp is None:
+            self._try_write_default(self._mappings_path, _EMPTY_MAPPINGS_JSON)
+            return _NO_MAPPINGS
+        cached = self._cached(self._mappings_path, stamp)
+        if cached is not None:
+            return cached
         try:
-            with open(self._mappings_path, "r", encoding="utf-8") as f:
-                data = json.load(f) or {}
+            with open(self._mappings_path, "rb") as f:
+                data = json_io.loads(f.read()) or {}
+            self._persisted[self._mappings_path] = (stamp, data)
             mappings = data.get("mappings", [])
             result: List[AppMapping] = []
+            lookup: Dict[str, Tuple[str, str]] = {}
             for m in mappings:
                 exe = (m.get("executable") or "").strip()
                 name = (m.get("name") or "").strip()
@@ -84,9 +171,13 @@ class ConfigStore:
                     result.append(
                         AppMapping(executable=exe, name=name, category=category)
                     )
-            return result
+                    lookup[exe.lower()] = (name, category)
         except Exception:
-            return []
+            # Remember an unreadable file too, so it is not re-parsed (and
+            # the caller's mapper not rebuilt) until it changes
+            result, lookup = [], {}
+        self._loaded[self._mappings_path] = (stamp, (result, lookup))
+        return result, lookup
 
     def save_mappings(self, mappings: List[AppMapping | Dict]) -> None:
         serializable = []
@@ -102,13 +193,13 @@ class ConfigStore:
                     serializable.append(
                         {"executable": exe, "name": name, "category": category}
                     )
-        with open(self._mappings_path, "w", encoding="utf-8") as f:
-            json.dump({"mappings": serializable}, f, indent=2)
+        self._persist(self._mappings_path, {"mappings": serializable})
 
     # Helpers
     def mapping_lookup(self) -> Dict[str, Tuple[str, str]]:
-        """Return dict: exe_lower -> (name, category)."""
-        table: Dict[str, Tuple[str, str]] = {}
-        for m in self.load_mappings():
-            table[m.executable.lower()] = (m.name, m.category)
-        return table
+        """Return dict: exe_lower -> (name, category).
+
+        The table is built once per file version and shared; treat it as
+        read-only.
+        """
+        return self._load_mappings()[1]
@@ -1,16 +1,79 @@
 """Data access utilities for UI components."""
 
 import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import attrgetter, itemgetter
+from statistics import fmean
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
-from ..utils.data_mappers import DataMapper
+import numpy as np
+
+from ..utils.data_mappers import format_percentage, format_time
 from ..utils.config_store import ConfigStore
 from ..utils.data_mappers import AppNameMapper
 
 logger = logging.getLogger(__name__)
 
+# Worker threads shared by dashboard queries and workspace app launches/closes
+_MAX_WORKERS = 8
+
+# Trend series shorter than this are clamped in Python, where NumPy's call
+# overhead would outweigh the vectorized work
+_VECTORIZE_TRENDS_MIN = 64
+
+# Read-only payloads returned by _retry_operation once retries are exhausted;
+# shared between calls so the failure path allocates nothing
+_EMPTY_ACTIVITIES_FALLBACK = ()
+_EMPTY_REPORT_FALLBACK = MappingProxyType(
+    {
+        "daily_metrics": MappingProxyType(
+            {"total_time": 0, "active_time": 0, "idle_time": 0}
+        ),
+        "app_patterns": MappingProxyType({}),
+        "category_patterns": MappingProxyType({}),
+        "productivity_trends": MappingProxyType(
+            {"hourly": (0.0,) * 24, "daily": (0.0,) * 7}
+        ),
+        "activities": (),
+        "insights": MappingProxyType(
+            {
+                "categories": MappingProxyType({}),
+                "overall_productivity": 0.0,
+                "suggestions": (),
+            }
+        ),
+    }
+)
+_EMPTY_SUGGESTIONS_FALLBACK = ()
+
+# Activity attributes copied into each activity row, fetched in one call
+_ACTIVITY_KEYS = (
+    "id",
+    "app_name",
+    "window_title",
+    "start_time",
+    "end_time",
+    "active_time",
+    "idle_time",
+    "executable_path",
+)
+_ACTIVITY_FIELDS = attrgetter(*_ACTIVITY_KEYS)
+
+
+def _to_float(value, default: float = 0.0) -> float:
+    """Coerce a numeric field to float, using default for missing or bad values."""
+    if value.__class__ is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
 
 class DataAccessManager:
     """Manages data access and transformation for UI components."""
@@ -22,6 +85,7 @@ class DataAccessManager:
         suggestion_service,
         max_retries: int = 3,
         retry_delay: float = 0.5,
+        max_retry_delay: float = 5.0,
     ):
         """Initialize data access manager.
 
@@ -31,24 +95,40 @@ class DataAccessManager:
             suggestion_service: Task suggestion service instance
             max_retries: Maximum number of retries for data access
             retry_delay: Base delay between retries in seconds
+            max_retry_delay: Upper bound for a single retry delay in seconds
         """
         self.analytics_service = analytics_service
         self.session_service = session_service
         self.suggestion_service = suggestion_service
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
         self._workspace_service = None
+        # Runs the independent dashboard queries and workspace app
+        # launches/closes concurrently; shut down by close()
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_WORKERS, thread_name_prefix="data-access"
+        )
         # Load presentation-layer mappings
         self._config_store = ConfigStore()
-        self._app_mapper = AppNameMapper(self._config_store.mapping_lookup())
+        self._mapping_table = self._config_store.mapping_lookup()
+        self._app_mapper = AppNameMapper(self._mapping_table)
 
     def _reload_mappings(self) -> None:
         """Reload mappings from JSON so changes take effect without restart."""
         try:
-            self._app_mapper = AppNameMapper(self._config_store.mapping_lookup())
+            # The store hands back the same table until the file changes
+            table = self._config_store.mapping_lookup()
+            if table is not self._mapping_table:
+                self._mapping_table = table
+                self._app_mapper = AppNameMapper(table)
         except Exception:
             pass
 
+    def close(self) -> None:
+        """Release the worker threads without waiting for running queries."""
+        self._executor.shutdown(wait=False)
+
     # Workspace ops (lazy load to avoid core service changes)
     @property
     def workspace_service(self):
@@ -97,10 +177,15 @@ class DataAccessManager:
         if not snap:
             return {"snapshot_id": None, "apps": []}
         details = []
-        # Attempt launches with per-app status using the existing controller
+        # Attempt launches with per-app status using the existing controller.
+        # Spawns are independent, so run them concurrently; map() keeps the
+        # results in snapshot order.
         controller = self.workspace_service.controller
-        for app in snap.apps:
-            ok = controller.start_app(app.executable_path, app.args)
+        apps = list(snap.apps)
+        launched = self._executor.map(
+            lambda app: controller.start_app(app.executable_path, app.args), apps
+        )
+        for app, ok in zip(apps, launched):
             name, category = self._app_mapper.map_executable(app.executable_path)
             details.append(
                 {
@@ -119,14 +204,21 @@ class DataAccessManager:
         self._reload_mappings()
         controller = self.workspace_service.controller
         running = controller.list_running_apps()
-        details = []
-        for app in running:
-            ok = False
+
+        def close(exe_name):
             try:
-                if app.name:
-                    ok = controller.close_app_by_exe(app.name)
+                return controller.close_app_by_exe(exe_name)
             except Exception:
-                ok = False
+                return False
+
+        # close_app_by_exe closes every process with that name, so close each
+        # name once, concurrently; repeats of a name report failure as the
+        # sequential loop did
+        names = list(dict.fromkeys(app.name for app in running if app.name))
+        closed = dict(zip(names, self._executor.map(close, names)))
+        details = []
+        for app in running:
+            ok = closed.pop(app.name, False) if app.name else False
             name, category = self._app_mapper.map_executable(app.exe)
             details.append(
                 {
@@ -141,8 +233,11 @@ class DataAccessManager:
             )
         return {"apps": details}
 
-    def _retry_operation(self, operation, *args, **kwargs) -> Any:
-        """Retry an operation with exponential backoff."""
+    def _retry_operation(self, operation, *args, fallback=None, **kwargs) -> Any:
+        """Retry an operation with jittered exponential backoff.
+
+        Returns ``fallback`` once all retries have failed.
+        """
         last_error = None
         for attempt in range(self.max_retries):
             try:
@@ -150,7 +245,10 @@ class DataAccessManager:
             except Exception as e:
                 last_error = e
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)
+                    # Equal jitter keeps concurrent callers from retrying
+                    # in lockstep after a shared backend failure
+                    delay = min(self.retry_delay * (2**attempt), self.max_retry_delay)
+                    delay *= 0.5 + random.random() * 0.5
                     logger.warning(
                         f"Data access attempt {attempt + 1} failed, "
                         f"retrying in {delay:.1f}s: {e}"
@@ -160,48 +258,59 @@ class DataAccessManager:
                     logger.error(f"All data access retries failed: {e}", exc_info=True)
 
         # Return empty data structure on failure
-        if "get_activities" in str(operation):
-            return []
-        elif "get_productivity_report" in str(operation):
-            return {
-                "daily_metrics": {"total_time": 0, "active_time": 0, "idle_time": 0},
-                "app_patterns": {},
-                "category_patterns": {},
-                "productivity_trends": {"hourly": [0.0] * 24, "daily": [0.0] * 7},
-                "activities": [],
-                "insights": {
-                    "categories": {},
-                    "overall_productivity": 0.0,
-                    "suggestions": [],
-                },
-            }
-        elif "get_current_suggestions" in str(operation):
-            return []
-        else:
-            return None
+        return fallback
 
-    def get_activities(self, time_window: timedelta) -> Dict[str, Any]:
-        """Get activities within time window with retry logic."""
-        self._reload_mappings()
-        end_time = datetime.now()
-        start_time = end_time - time_window
+    def _iter_activity_rows(self, start_time: datetime, end_time: datetime):
+        """Yield UI activity rows with their active and idle seconds.
 
-        try:
-            activities = self._retry_operation(
-                self.session_service.repository.get_by_timerange, start_time, end_time
-            )
+        Rows are mapped and formatted only as they are consumed.
 
-            # Transform Activity objects to dictionaries
-            activity_list = []
-            total_active_time = 0
-            total_idle_time = 0
+        Args:
+            start_time: Start of the range to fetch activities for
+            end_time: End of the range to fetch activities for
 
-            for activity in activities:
-                # Handle both dictionary and Activity object formats
-                if isinstance(activity, dict):
-                    activity_dict = activity
-                else:
-                    # Activity object - access attributes directly
+        Yields:
+            Tuples of (row, active_time, idle_time)
+        """
+        activities = self._retry_operation(
+            self.session_service.repository.get_by_timerange,
+            start_time,
+            end_time,
+            fallback=_EMPTY_ACTIVITIES_FALLBACK,
+        )
+
+        # Many rows share the same second, so parse and format each
+        # distinct timestamp only once per call
+        timestamp_cache = {}
+
+        def format_timestamp(value):
+            try:
+                return timestamp_cache[value]
+            except KeyError:
+                pass
+            parsed = value
+            # Ensure datetime objects for timestamps
+            if isinstance(parsed, str):
+                try:
+                    parsed = datetime.fromisoformat(parsed)
+                except (ValueError, TypeError):
+                    parsed = None
+            formatted = parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else "N/A"
+            timestamp_cache[value] = formatted
+            return formatted
+
+        # Transform Activity objects to dictionaries
+        for activity in activities:
+            # Handle both dictionary and Activity object formats
+            if isinstance(activity, dict):
+                activity_dict = activity
+            else:
+                # Activity object - access attributes directly
+                try:
+                    activity_dict = dict(
+                        zip(_ACTIVITY_KEYS, _ACTIVITY_FIELDS(activity))
+                    )
+                except AttributeError:
                     activity_dict = {
                         "id": getattr(activity, "id", ""),
                         "app_name": getattr(activity, "app_name", "Unknown"),
@@ -213,60 +322,58 @@ class DataAccessManager:
                         "executable_path": getattr(activity, "executable_path", ""),
                     }
 
-                # Ensure datetime objects for timestamps
-                if isinstance(activity_dict["start_time"], str):
-                    try:
-                        activity_dict["start_time"] = datetime.fromisoformat(
-                            activity_dict["start_time"]
-                        )
-                    except (ValueError, TypeError):
-                        activity_dict["start_time"] = None
-
-                if isinstance(activity_dict["end_time"], str):
-                    try:
-                        activity_dict["end_time"] = datetime.fromisoformat(
-                            activity_dict["end_time"]
-                        )
-                    except (ValueError, TypeError):
-                        activity_dict["end_time"] = None
-
-                # Apply app mapping
-                exe_source = activity_dict.get("executable_path") or activity_dict.get(
-                    "app_name", ""
-                )
-                friendly_name, category = self._app_mapper.map_executable(exe_source)
+            # Apply app mapping
+            exe_source = activity_dict.get("executable_path") or activity_dict.get(
+                "app_name", ""
+            )
+            friendly_name, category = self._app_mapper.map_executable(exe_source)
 
-                # Format timestamps for UI
-                activity_dict["start_time"] = (
-                    activity_dict["start_time"].strftime("%Y-%m-%d %H:%M:%S")
-                    if activity_dict["start_time"]
-                    else "N/A"
-                )
-                activity_dict["end_time"] = (
-                    activity_dict["end_time"].strftime("%Y-%m-%d %H:%M:%S")
-                    if activity_dict["end_time"]
-                    else "N/A"
-                )
+            # Format timestamps for UI
+            activity_dict["start_time"] = format_timestamp(activity_dict["start_time"])
+            activity_dict["end_time"] = format_timestamp(activity_dict["end_time"])
 
-                # Ensure numeric values
-                try:
-                    active_time = float(activity_dict["active_time"])
-                except (ValueError, TypeError):
-                    active_time = 0
-                try:
-                    idle_time = float(activity_dict["idle_time"])
-                except (ValueError, TypeError):
-                    idle_time = 0
-
-                total_time = active_time + idle_time
-                activity_list.append(
-                    {
-                        **activity_dict,
-                        "display_name": friendly_name,
-                        "category": category,
-                        "total_time": total_time,
-                    }
-                )
+            # Ensure numeric values
+            active_time = _to_float(activity_dict["active_time"])
+            idle_time = _to_float(activity_dict["idle_time"])
+
+            total_time = active_time + idle_time
+            # activity_dict is already ours, so extend it in place
+            activity_dict["display_name"] = friendly_name
+            activity_dict["category"] = category
+            activity_dict["total_time"] = total_time
+            yield activity_dict, active_time, idle_time
+
+    def get_activities(
+        self,
+        time_window: timedelta,
+        reload_mappings: bool = True,
+        limit: Optional[int] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Get activities within time window with retry logic.
+
+        Args:
+            time_window: Time window to fetch activities for
+            reload_mappings: Whether to reload app mappings first
+            limit: Maximum number of rows to return, or None for all. Totals
+                cover the returned rows only.
+            end_time: End of the window, or None for now
+
+        Returns:
+            Dictionary with the activity list and time totals
+        """
+        if reload_mappings:
+            self._reload_mappings()
+
+        end_time = end_time or datetime.now()
+
+        try:
+            activity_list = []
+            total_active_time = 0
+            total_idle_time = 0
+            rows = self._iter_activity_rows(end_time - time_window, end_time)
+            for row, active_time, idle_time in islice(rows, limit):
+                activity_list.append(row)
                 total_active_time += active_time
                 total_idle_time += idle_time
 
@@ -286,31 +393,17 @@ class DataAccessManager:
                 "total_time": 0,
             }
 
-    def _parse_time_to_seconds(self, time_str: str) -> float:
-        """Parse time string to seconds for sorting."""
-        try:
-            if "h" in time_str:
-                parts = time_str.split("h")
-                hours = float(parts[0].strip())
-                minutes = float(parts[1].strip("m").strip()) if "m" in parts[1] else 0
-                return hours * 3600 + minutes * 60
-            elif "m" in time_str:
-                minutes = float(time_str.strip("m").strip())
-                return minutes * 60
-            elif "s" in time_str:
-                seconds = float(time_str.strip("s").strip())
-                return seconds
-            return 0
-        except Exception as e:
-            logger.error(f"Error parsing time string '{time_str}': {e}")
-            return 0
-
-    def get_productivity_data(self, time_window: timedelta) -> Dict[str, Any]:
+    def get_productivity_data(
+        self, time_window: timedelta, reload_mappings: bool = True
+    ) -> Dict[str, Any]:
         """Get productivity data with retry logic."""
-        self._reload_mappings()
+        if reload_mappings:
+            self._reload_mappings()
         try:
             report = self._retry_operation(
-                self.analytics_service.get_productivity_report, time_window
+                self.analytics_service.get_productivity_report,
+                time_window,
+                fallback=_EMPTY_REPORT_FALLBACK,
             )
 
             if not report:
@@ -318,163 +411,157 @@ class DataAccessManager:
                 return self._get_empty_metrics()
 
             # Mapping for app names
-            exe_map = self._app_mapper
-
-            # Get daily metrics
-            daily_metrics = report.get("daily_metrics", {})
-            total_time = float(daily_metrics.get("total_time", 0))
-            active_time = float(daily_metrics.get("active_time", 0))
-            idle_time = float(daily_metrics.get("idle_time", 0))
-
-            # Get app patterns
-            app_patterns = report.get("app_patterns", {})
-            app_data = []
-            for app_key, stats in app_patterns.items():
-                friendly_name, category = exe_map.map_executable(app_key)
-                app_time = float(stats.get("total_time", 0))
-                app_percentage = float(stats.get("usage_percentage", 0)) * 100
-                app_data.append(
-                    [
-                        friendly_name,
-                        DataMapper.format_time(app_time),
-                        DataMapper.format_percentage(app_percentage / 100),
-                    ]
-                )
-
-            # Sort app data by time descending
-            app_data.sort(key=lambda x: self._parse_time_to_seconds(x[1]), reverse=True)
-
-            # Build category totals strictly from mapped app totals to avoid double counting
-            merged_category = {}
-            for app_key, stats in app_patterns.items():
-                _, mapped_category = exe_map.map_executable(app_key)
-                t = float(stats.get("total_time", 0))
-                agg = merged_category.setdefault(
-                    mapped_category, {"total_time": 0.0, "usage_percentage": 0.0}
-                )
-                agg["total_time"] += t
-
-            # Compute category usage percentage as share of overall total_time
-            safe_total = total_time if total_time > 0 else 1.0
-            for cat_name, stats in merged_category.items():
-                stats["usage_percentage"] = stats["total_time"] / safe_total
-
-            category_data = []
-            for cat_name, stats in merged_category.items():
-                cat_time = float(stats.get("total_time", 0))
-                cat_percentage_ratio = float(stats.get("usage_percentage", 0))
-                category_data.append(
-                    [
-                        cat_name,
-                        DataMapper.format_time(cat_time),
-                        DataMapper.format_percentage(cat_percentage_ratio),
-                    ]
-                )
+            map_executable = self._app_mapper.map_executable
 
-            # Sort category data by time descending
-            category_data.sort(
-                key=lambda x: self._parse_time_to_seconds(x[1]), reverse=True
-            )
+            # Read each report section once
+            daily_metrics = report.get("daily_metrics") or {}
+            app_patterns = report.get("app_patterns") or {}
+            insights = report.get("insights") or {}
+            activities = report.get("activities") or []
+            trends = report.get("productivity_trends") or {}
 
-            # Calculate focus and break time
-            # Focus time: sum of active time for apps with high within-app efficiency and productive category
-            # Break time: keep existing heuristic based on very low usage share (< 10%)
-            focus_time = 0
-            break_time = 0
+            # Get daily metrics
+            total_time = _to_float(daily_metrics.get("total_time"))
+            active_time = _to_float(daily_metrics.get("active_time"))
+            idle_time = _to_float(daily_metrics.get("idle_time"))
 
             # Build category productivity map from insights if available
             try:
-                _insights_for_focus = (
-                    report.get("insights", {}) if isinstance(report, dict) else {}
-                )
                 _cat_prod_map = {
                     cat: float(info.get("productivity_score", 0.0))
                     for cat, info in (
-                        _insights_for_focus.get("category_distribution", {}) or {}
+                        insights.get("category_distribution", {}) or {}
                     ).items()
                 }
             except Exception:
                 _cat_prod_map = {}
 
+            # One pass over app patterns builds the app rows, the category
+            # totals and the focus/break times.
+            # Category totals come strictly from mapped app totals to avoid
+            # double counting.
+            # Focus time: sum of active time for apps with high within-app
+            # efficiency and productive category.
+            # Break time: keep existing heuristic based on very low usage
+            # share (< 10%).
+            app_rows = []  # (seconds, row) so rows sort on the raw time
+            merged_category = {}
+            focus_time = 0
+            break_time = 0
             for app_key, stats in app_patterns.items():
-                app_active_time = float(stats.get("active_time", 0))
-                app_total_time = float(stats.get("total_time", 0))
-                app_efficiency = (
-                    (app_active_time / app_total_time) if app_total_time > 0 else 0.0
+                friendly_name, category = map_executable(app_key)
+                app_time = _to_float(stats.get("total_time"))
+                app_active_time = _to_float(stats.get("active_time"))
+                app_share = _to_float(stats.get("usage_percentage"))
+
+                app_rows.append(
+                    (
+                        app_time,
+                        [
+                            friendly_name,
+                            format_time(app_time),
+                            format_percentage(app_share),
+                        ],
+                    )
                 )
 
-                # Map app to category using UI mapper
-                _, category = exe_map.map_executable(app_key)
-                category_productivity = float(_cat_prod_map.get(category, 0.4))
+                agg = merged_category.get(category)
+                if agg is None:
+                    agg = merged_category[category] = {
+                        "total_time": 0.0,
+                        "usage_percentage": 0.0,
+                    }
+                agg["total_time"] += app_time
 
+                app_efficiency = (app_active_time / app_time) if app_time > 0 else 0.0
+                category_productivity = _cat_prod_map.get(category, 0.4)
                 # Focus: high efficiency and productive category
                 if app_efficiency >= 0.8 and category_productivity >= 0.8:
                     focus_time += app_active_time
                 # Break: retain existing rule for very low usage share
-                elif float(stats.get("usage_percentage", 0)) < 0.1:
+                elif app_share < 0.1:
                     break_time += app_active_time
 
+            # Sort app data by time descending
+            app_rows.sort(key=itemgetter(0), reverse=True)
+            app_data = [row for _, row in app_rows]
+
+            # Category usage percentage as share of overall total_time
+            safe_total = total_time if total_time > 0 else 1.0
+            category_rows = []
+            for cat_name, stats in merged_category.items():
+                cat_time = stats["total_time"]
+                stats["usage_percentage"] = cat_ratio = cat_time / safe_total
+                category_rows.append(
+                    (
+                        cat_time,
+                        [
+                            cat_name,
+                            format_time(cat_time),
+                            format_percentage(cat_ratio),
+                        ],
+                    )
+                )
+
+            # Sort category data by time descending
+            category_rows.sort(key=itemgetter(0), reverse=True)
+            category_data = [row for _, row in category_rows]
+
             # Get productivity score from insights
-            insights = report.get("insights", {})
             productivity_score = float(insights.get("overall_productivity", 0))
 
             # Calculate efficiency (active vs total time)
             efficiency_score = active_time / total_time if total_time > 0 else 0
 
             # Calculate average session time from active periods
-            activities = report.get("activities", [])
             if activities:
                 # Sort activities by start time
                 sorted_activities = sorted(
                     activities, key=lambda x: x.get("start_time", datetime.min)
                 )
 
-                # Find continuous sessions (gaps less than 5 minutes)
-                sessions = []
-                current_session = []
+                # Sweep for continuous sessions (gaps less than 5 minutes),
+                # tracking only each session's start, last end and length
+                session_durations = []
+                session_start = None
+                session_end = None
+                session_len = 0
 
                 for activity in sorted_activities:
-                    if not current_session:
-                        current_session = [activity]
-                    else:
-                        prev_end = current_session[-1].get("end_time")
-                        curr_start = activity.get("start_time")
+                    if not session_len:
+                        session_start = activity.get("start_time")
+                        session_end = activity.get("end_time")
+                        session_len = 1
+                        continue
 
-                        if prev_end and curr_start:
-                            gap = (curr_start - prev_end).total_seconds()
-                            if gap < 300:  # 5 minutes
-                                current_session.append(activity)
-                            else:
-                                if len(current_session) > 1:
-                                    sessions.append(current_session)
-                                current_session = [activity]
+                    curr_start = activity.get("start_time")
+                    if not (session_end and curr_start):
+                        continue
 
-                if len(current_session) > 1:
-                    sessions.append(current_session)
+                    if (curr_start - session_end).total_seconds() < 300:  # 5 minutes
+                        session_end = activity.get("end_time")
+                        session_len += 1
+                    else:
+                        if session_len > 1 and session_start and session_end:
+                            session_durations.append(
+                                (session_end - session_start).total_seconds()
+                            )
+                        session_start = curr_start
+                        session_end = activity.get("end_time")
+                        session_len = 1
+
+                if session_len > 1 and session_start and session_end:
+                    session_durations.append(
+                        (session_end - session_start).total_seconds()
+                    )
 
                 # Calculate average session duration
-                if sessions:
-                    session_durations = []
-                    for session in sessions:
-                        if len(session) > 1:
-                            start = session[0].get("start_time")
-                            end = session[-1].get("end_time")
-                            if start and end:
-                                duration = (end - start).total_seconds()
-                                session_durations.append(duration)
-
-                    avg_session_time = (
-                        sum(session_durations) / len(session_durations)
-                        if session_durations
-                        else 0
-                    )
-                else:
-                    avg_session_time = 0
+                avg_session_time = fmean(session_durations) if session_durations else 0
             else:
                 avg_session_time = 0
 
-            # Calculate hourly distribution
-            hourly_distribution = {}
+            # Calculate hourly distribution into fixed hour buckets
+            hourly = [0.0] * 24
             for activity in activities:
                 try:
                     start_time = activity.get("start_time")
@@ -484,18 +571,14 @@ class DataAccessManager:
                     if not isinstance(start_time, datetime):
                         continue
 
-                    hour = start_time.hour
-                    duration = float(activity.get("active_time", 0))
-
-                    if hour not in hourly_distribution:
-                        hourly_distribution[hour] = 0
-                    hourly_distribution[hour] += duration
+                    hourly[start_time.hour] += float(activity.get("active_time", 0))
 
                 except (ValueError, TypeError) as e:
                     logger.warning(
                         f"Error processing activity for hourly distribution: {e}"
                     )
                     continue
+            hourly_distribution = dict(enumerate(hourly))
 
             # Transform productivity data for UI
             metrics = {
@@ -519,15 +602,24 @@ class DataAccessManager:
             }
 
             # Get productivity trends
-            trends = report.get("productivity_trends", {})
             daily_trends = trends.get("daily", [])
 
             # Ensure trends are valid numbers between 0 and 1
-            daily_trends = [
-                max(0.0, min(1.0, float(x)))
-                for x in daily_trends
-                if isinstance(x, (int, float, str))
-            ]
+            if len(daily_trends) >= _VECTORIZE_TRENDS_MIN:
+                arr = np.asarray(
+                    [x for x in daily_trends if isinstance(x, (int, float, str))],
+                    dtype=np.float64,
+                )
+                # NaN clamps to 1.0, matching min()/max() on the small path
+                arr[np.isnan(arr)] = 1.0
+                np.clip(arr, 0.0, 1.0, out=arr)
+                daily_trends = arr.tolist()
+            else:
+                daily_trends = [
+                    max(0.0, min(1.0, float(x)))
+                    for x in daily_trends
+                    if isinstance(x, (int, float, str))
+                ]
 
             return {
                 "metrics": metrics,
@@ -571,7 +663,9 @@ class DataAccessManager:
         try:
             return (
                 self._retry_operation(
-                    self.suggestion_service.get_current_suggestions, time_window
+                    self.suggestion_service.get_current_suggestions,
+                    time_window,
+                    fallback=_EMPTY_SUGGESTIONS_FALLBACK,
                 )
                 or []
             )
@@ -582,14 +676,26 @@ class DataAccessManager:
     def get_dashboard_data(self, time_window: timedelta) -> Dict[str, Any]:
         """Get all dashboard data with retry logic."""
         try:
-            activities = self.get_activities(time_window)
-            productivity = self.get_productivity_data(time_window)
-            suggestions = self.get_suggestions(time_window)
+            # Reload once here rather than in each concurrent query
+            self._reload_mappings()
+            # Pin the activities window to this tick's clock reading
+            end_time = datetime.now()
+            activities = self._executor.submit(
+                self.get_activities,
+                time_window,
+                reload_mappings=False,
+                end_time=end_time,
+            )
+            productivity = self._executor.submit(
+                self.get_productivity_data, time_window, reload_mappings=False
+            )
+            suggestions = self._executor.submit(self.get_suggestions, time_window)
 
+            # Each query already falls back to empty data on its own errors
             return {
-                "activities": activities,
-                "productivity": productivity,
-                "suggestions": suggestions,
+                "activities": activities.result(),
+                "productivity": productivity.result(),
+                "suggestions": suggestions.result(),
             }
 
         except Exception as e:
@@ -2,18 +2,48 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Dict, Tuple, List, Any
 from datetime import datetime
 
 
+def format_time(seconds: float) -> str:
+    """Format a duration in seconds as ``"Xh Ym"``, ``"Ym"`` or ``"Zs"``."""
+    seconds = float(seconds or 0)
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    minutes, _ = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+def format_percentage(value: float) -> str:
+    """Format a 0..1 ratio as a percentage with one decimal."""
+    try:
+        # DataAccess passes 0..1 values; keep behavior
+        return f"{float(value) * 100:.1f}%"
+    except Exception:
+        return "0.0%"
+
+
 class AppNameMapper:
     """Maps process executables to user-friendly names and categories."""
 
+    # map_executable is a slot because __init__ binds the memoized wrapper
+    __slots__ = ("_map", "map_executable")
+
     def __init__(self, exe_to_name_category: Dict[str, Tuple[str, str]]):
         self._map = {k.lower(): v for k, v in exe_to_name_category.items()}
+        # Mappers are rebuilt whenever the mappings change, so memoizing
+        # per instance can never serve a stale result
+        self.map_executable = functools.lru_cache(maxsize=2048)(self._map_executable)
 
-    def map_executable(self, executable_path_or_name: str) -> Tuple[str, str]:
-        exe = (executable_path_or_name or "").split("\\")[-1].split("/")[-1]
+    def _map_executable(self, executable_path_or_name: str) -> Tuple[str, str]:
+        path = executable_path_or_name or ""
+        # Basename after the last separator of either kind
+        exe = path[max(path.rfind("\\"), path.rfind("/")) + 1 :]
         key = exe.lower()
         name, category = self._map.get(key, (exe, "Unknown"))
         return name, category
@@ -22,25 +52,12 @@ class AppNameMapper:
 class DataMapper:
     """Backward-compatible helpers for time and percentage formatting."""
 
-    @staticmethod
-    def format_time(seconds: float) -> str:
-        seconds = float(seconds or 0)
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        minutes = seconds // 60
-        hours = minutes // 60
-        minutes = minutes % 60
-        if hours:
-            return f"{int(hours)}h {int(minutes)}m"
-        return f"{int(minutes)}m"
+    __slots__ = ()
 
-    @staticmethod
-    def format_percentage(value: float) -> str:
-        try:
-            # DataAccess passes 0..1 values; keep behavior
-            return f"{float(value) * 100:.1f}%"
-        except Exception:
-            return "0.0%"
+    # Kept as delegates for existing callers; hot loops call the
+    # module-level functions directly
+    format_time = staticmethod(format_time)
+    format_percentage = staticmethod(format_percentage)
 
     @staticmethod
     def map_activity_list(activities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -65,9 +82,9 @@ class DataMapper:
                         "app_name": str(app_name),
                         "window_title": str(window_title),
                         "start_time": str(start_time),
-                        "duration": DataMapper.format_time(total),
-                        "active_time": DataMapper.format_time(active),
-                        "idle_time": DataMapper.format_time(idle),
+                        "duration": format_time(total),
+                        "active_time": format_time(active),
+                        "idle_time": format_time(idle),
                     }
                 )
             except Exception:
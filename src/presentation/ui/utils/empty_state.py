@@ -2,12 +2,51 @@
 
 from PySide6.QtCore import Qt, Signal as pyqtSignal
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton, QSizePolicy
-from PySide6.QtGui import QIcon, QPixmap
 from typing import Optional, Callable
 import logging
 
+from .icon_cache import standard_pixmap
+
 logger = logging.getLogger(__name__)
 
+# Stylesheets are shared by every empty state instead of rebuilt per widget
+_MESSAGE_QSS = """
+QLabel {
+    font-size: 16px;
+    font-weight: bold;
+    color: #424242;
+}
+"""
+_DETAIL_QSS = """
+QLabel {
+    color: #757575;
+}
+"""
+_BUTTON_QSS = """
+QPushButton {
+    padding: 8px 16px;
+    background-color: #2196F3;
+    color: white;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #1976D2;
+}
+QPushButton:pressed {
+    background-color: #1565C0;
+}
+"""
+_CONTAINER_QSS = """
+EmptyStateWidget {
+    background-color: #fafafa;
+    border-radius: 8px;
+}
+"""
+
+# Shared size policy; setSizePolicy copies it, so one instance serves all widgets
+_EXPANDING = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
 
 class EmptyStateWidget(QWidget):
     """Widget for displaying empty states."""
@@ -24,109 +63,66 @@ class EmptyStateWidget(QWidget):
         parent: Optional[QWidget] = None,
     ):
         """Initialize empty state widget."""
-        try:
-            super().__init__(parent)
+        super().__init__(parent)
 
-            self.message = message
-            self.detail = detail
-            self.action_text = action_text
-            self.icon_name = icon_name
+        self.message = message
+        self.detail = detail
+        self.action_text = action_text
+        self.icon_name = icon_name
 
-            # Setup UI
-            self.setup_ui()
+        # Set size policy
+        self.setSizePolicy(_EXPANDING)
 
-            logger.debug("Empty state widget initialized")
+        # UI is built on first show
+        self._ui_built = False
 
-        except Exception as e:
-            logger.error(f"Error initializing empty state: {e}", exc_info=True)
-            raise
+        logger.debug("Empty state widget initialized")
 
     def setup_ui(self):
         """Set up the empty state UI."""
-        try:
-            # Create layout
-            layout = QVBoxLayout(self)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setSpacing(16)
-
-            # Add icon
-            icon_label = QLabel()
-            icon = self.style().standardIcon(
-                getattr(self.style().StandardPixmap, self.icon_name)
-            )
-            icon_label.setPixmap(icon.pixmap(64, 64))
-            layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignCenter)
-
-            # Add message
-            message_label = QLabel(self.message)
-            message_label.setWordWrap(True)
-            message_label.setStyleSheet(
-                """
-                QLabel {
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: #424242;
-                }
-            """
-            )
-            layout.addWidget(message_label, 0, Qt.AlignmentFlag.AlignCenter)
-
-            # Add detail if provided
-            if self.detail:
-                detail_label = QLabel(self.detail)
-                detail_label.setWordWrap(True)
-                detail_label.setStyleSheet(
-                    """
-                    QLabel {
-                        color: #757575;
-                    }
-                """
-                )
-                layout.addWidget(detail_label, 0, Qt.AlignmentFlag.AlignCenter)
-
-            # Add action button if provided
-            if self.action_text:
-                action_button = QPushButton(self.action_text)
-                action_button.setStyleSheet(
-                    """
-                    QPushButton {
-                        padding: 8px 16px;
-                        background-color: #2196F3;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                    }
-                    QPushButton:hover {
-                        background-color: #1976D2;
-                    }
-                    QPushButton:pressed {
-                        background-color: #1565C0;
-                    }
-                """
-                )
-                action_button.clicked.connect(self.actionTriggered)
-                layout.addWidget(action_button, 0, Qt.AlignmentFlag.AlignCenter)
-
-            # Set size policy
-            self.setSizePolicy(
-                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-            )
-
-            # Style
-            self.setStyleSheet(
-                """
-                EmptyStateWidget {
-                    background-color: #fafafa;
-                    border-radius: 8px;
-                }
-            """
-            )
-
-            logger.debug("Empty state UI setup complete")
-
-        except Exception as e:
-            logger.error(f"Error setting up empty state UI: {e}", exc_info=True)
-            raise
+        # Create layout detached; it is attached once fully populated
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setSpacing(16)
+
+        # Add icon
+        icon_label = QLabel()
+        icon_label.setPixmap(standard_pixmap(self, self.icon_name, 64, 64))
+        layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignCenter)
+
+        # Add message
+        message_label = QLabel(self.message)
+        message_label.setWordWrap(True)
+        message_label.setStyleSheet(_MESSAGE_QSS)
+        layout.addWidget(message_label, 0, Qt.AlignmentFlag.AlignCenter)
+
+        # Add detail if provided
+        if self.detail:
+            detail_label = QLabel(self.detail)
+            detail_label.setWordWrap(True)
+            detail_label.setStyleSheet(_DETAIL_QSS)
+            layout.addWidget(detail_label, 0, Qt.AlignmentFlag.AlignCenter)
+
+        # Add action button if provided
+        if self.action_text:
+            action_button = QPushButton(self.action_text)
+            action_button.setStyleSheet(_BUTTON_QSS)
+            action_button.clicked.connect(self.actionTriggered)
+            layout.addWidget(action_button, 0, Qt.AlignmentFlag.AlignCenter)
+
+        self.setLayout(layout)
+
+        # Style
+        self.setStyleSheet(_CONTAINER_QSS)
+
+        logger.debug("Empty state UI setup complete")
+
+    def showEvent(self, event):
+        """Build the UI the first time the widget is shown."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        super().showEvent(event)
 
 
 class NoDataWidget(EmptyStateWidget):
@@ -140,14 +136,9 @@ class NoDataWidget(EmptyStateWidget):
         action_text: str = "Refresh",
     ):
         """Initialize no data widget."""
-        try:
-            super().__init__(message, detail, action_text, "SP_FileIcon", parent)
-
-            logger.debug("No data widget initialized")
+        super().__init__(message, detail, action_text, "SP_FileIcon", parent)
 
-        except Exception as e:
-            logger.error(f"Error initializing no data widget: {e}", exc_info=True)
-            raise
+        logger.debug("No data widget initialized")
 
 
 class NoResultsWidget(EmptyStateWidget):
@@ -161,16 +152,11 @@ class NoResultsWidget(EmptyStateWidget):
         action_text: str = "Clear Filters",
     ):
         """Initialize no results widget."""
-        try:
-            super().__init__(
-                message, detail, action_text, "SP_FileDialogContentsView", parent
-            )
+        super().__init__(
+            message, detail, action_text, "SP_FileDialogContentsView", parent
+        )
 
-            logger.debug("No results widget initialized")
-
-        except Exception as e:
-            logger.error(f"Error initializing no results widget: {e}", exc_info=True)
-            raise
+        logger.debug("No results widget initialized")
 
 
 class NoActivityWidget(EmptyStateWidget):
@@ -184,14 +170,9 @@ class NoActivityWidget(EmptyStateWidget):
         action_text: str = "",
     ):
         """Initialize no activity widget."""
-        try:
-            super().__init__(message, detail, action_text, "SP_ComputerIcon", parent)
-
-            logger.debug("No activity widget initialized")
+        super().__init__(message, detail, action_text, "SP_ComputerIcon", parent)
 
-        except Exception as e:
-            logger.error(f"Error initializing no activity widget: {e}", exc_info=True)
-            raise
+        logger.debug("No activity widget initialized")
 
 
 class NoStatisticsWidget(EmptyStateWidget):
@@ -205,16 +186,11 @@ class NoStatisticsWidget(EmptyStateWidget):
         action_text: str = "",
     ):
         """Initialize no statistics widget."""
-        try:
-            super().__init__(
-                message, detail, action_text, "SP_TitleBarContextHelpButton", parent
-            )
-
-            logger.debug("No statistics widget initialized")
+        super().__init__(
+            message, detail, action_text, "SP_TitleBarContextHelpButton", parent
+        )
 
-        except Exception as e:
-            logger.error(f"Error initializing no statistics widget: {e}", exc_info=True)
-            raise
+        logger.debug("No statistics widget initialized")
 
 
 class EmptyChartWidget(EmptyStateWidget):
@@ -228,16 +204,9 @@ class EmptyChartWidget(EmptyStateWidget):
         action_text: str = "",
     ):
         """Initialize empty chart widget."""
-        try:
-            super().__init__(
-                message, detail, action_text, "SP_DialogApplyButton", parent
-            )
+        super().__init__(message, detail, action_text, "SP_DialogApplyButton", parent)
 
-            logger.debug("Empty chart widget initialized")
-
-        except Exception as e:
-            logger.error(f"Error initializing empty chart widget: {e}", exc_info=True)
-            raise
+        logger.debug("Empty chart widget initialized")
 
 
 class EmptyTableWidget(EmptyStateWidget):
@@ -251,13 +220,6 @@ class EmptyTableWidget(EmptyStateWidget):
         action_text: str = "",
     ):
         """Initialize empty table widget."""
-        try:
-            super().__init__(
-                message, detail, action_text, "SP_DialogApplyButton", parent
-            )
-
-            logger.debug("Empty table widget initialized")
+        super().__init__(message, detail, action_text, "SP_DialogApplyButton", parent)
 
-        except Exception as e:
-            logger.error(f"Error initializing empty table widget: {e}", exc_info=True)
-            raise
+        logger.debug("Empty table widget initialized")
@@ -1,6 +1,6 @@
 """Error handling utilities."""
 
-from PySide6.QtCore import Qt, QObject, Signal as pyqtSignal, QTimer, QPoint
+from PySide6.QtCore import Qt, QObject, Signal as pyqtSignal, Slot, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QLabel,
@@ -9,15 +9,27 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QFrame,
     QApplication,
+    QSizePolicy,
 )
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QIcon
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Deque, Tuple
+from collections import deque
 from enum import Enum
+from functools import partial
 import logging
-import traceback
+import queue
+import time
+
+from .icon_cache import standard_icon, standard_pixmap
 
 logger = logging.getLogger(__name__)
 
+# Log-driven notifications are batched for this long before being shown
+_LOG_FLUSH_DELAY_MS = 50
+# At most this many notifications are shown per batch (newest kept)
+_MAX_LOG_NOTIFICATIONS_PER_FLUSH = 5
+# A message already shown is not shown again within this many seconds
+_LOG_REPEAT_WINDOW_SEC = 10.0
+
 
 class ErrorSeverity(Enum):
     """Error severity levels."""
@@ -28,9 +40,88 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Log notifications of these severities are never dropped from a burst
+_URGENT = frozenset((ErrorSeverity.ERROR, ErrorSeverity.CRITICAL))
+
+# Map logging levels to severity
+_SEVERITY_MAP = {
+    logging.INFO: ErrorSeverity.INFO,
+    logging.WARNING: ErrorSeverity.WARNING,
+    logging.ERROR: ErrorSeverity.ERROR,
+    logging.CRITICAL: ErrorSeverity.CRITICAL,
+}
+
+# (background, border, accent) colors per severity
+_SEVERITY_COLORS = {
+    ErrorSeverity.INFO: ("#E3F2FD", "#2196F3", "#1976D2"),  # Light Blue
+    ErrorSeverity.WARNING: ("#FFF3E0", "#FF9800", "#F57C00"),  # Orange
+    ErrorSeverity.ERROR: ("#FFEBEE", "#F44336", "#D32F2F"),  # Red
+    ErrorSeverity.CRITICAL: ("#FCE4EC", "#E91E63", "#C2185B"),  # Pink
+}
+
+_NOTIFICATION_QSS_TEMPLATE = """
+QFrame {{
+    background-color: {bg_color};
+    border: 1px solid {border_color};
+    border-radius: 4px;
+}}
+QLabel {{
+    background: transparent;
+    border: none;
+}}
+QPushButton#notificationClose {{
+    background: transparent;
+    border: none;
+}}
+QPushButton#notificationClose:hover {{
+    background: rgba(0, 0, 0, 0.1);
+    border-radius: 2px;
+}}
+"""
+
+# Notification stylesheets, formatted once per severity rather than per toast
+_NOTIFICATION_QSS = {
+    severity: _NOTIFICATION_QSS_TEMPLATE.format(
+        bg_color=bg_color, border_color=border_color
+    )
+    for severity, (bg_color, border_color, _) in _SEVERITY_COLORS.items()
+}
+
+_ERROR_MESSAGE_QSS = """
+QLabel {
+    font-size: 16px;
+    font-weight: bold;
+    color: #D32F2F;
+}
+"""
+_ERROR_DETAIL_QSS = """
+QLabel {
+    color: #757575;
+}
+"""
+_RETRY_BUTTON_QSS = """
+QPushButton {
+    padding: 8px 16px;
+    background-color: #F44336;
+    color: white;
+    border: none;
+    border-radius: 4px;
+}
+QPushButton:hover {
+    background-color: #E53935;
+}
+QPushButton:pressed {
+    background-color: #D32F2F;
+}
+"""
+
+
 class ErrorNotification(QFrame):
     """Toast-style error notification widget."""
 
+    # Emitted once when the notification is dismissed
+    closed = pyqtSignal()
+
     def __init__(
         self,
         message: str,
@@ -44,14 +135,11 @@ class ErrorNotification(QFrame):
         self.message = message
         self.severity = severity
         self.timeout = timeout
+        self.is_closed = False
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         # Colors for different severities
-        self.colors = {
-            ErrorSeverity.INFO: ("#E3F2FD", "#2196F3", "#1976D2"),  # Light Blue
-            ErrorSeverity.WARNING: ("#FFF3E0", "#FF9800", "#F57C00"),  # Orange
-            ErrorSeverity.ERROR: ("#FFEBEE", "#F44336", "#D32F2F"),  # Red
-            ErrorSeverity.CRITICAL: ("#FCE4EC", "#E91E63", "#C2185B"),  # Pink
-        }
+        self.colors = _SEVERITY_COLORS
 
         # Setup UI
         self.setup_ui()
@@ -65,8 +153,8 @@ class ErrorNotification(QFrame):
         # Set frame style
         self.setFrameStyle(QFrame.Shape.NoFrame)
 
-        # Create layout
-        layout = QHBoxLayout(self)
+        # Create layout detached; it is attached once fully populated
+        layout = QHBoxLayout()
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(8)
 
@@ -79,11 +167,7 @@ class ErrorNotification(QFrame):
         }[self.severity]
 
         icon_label = QLabel()
-        icon_label.setPixmap(
-            self.style()
-            .standardIcon(getattr(self.style().StandardPixmap, icon_name))
-            .pixmap(16, 16)
-        )
+        icon_label.setPixmap(standard_pixmap(self, icon_name, 16, 16))
         layout.addWidget(icon_label)
 
         # Add message
@@ -93,47 +177,30 @@ class ErrorNotification(QFrame):
 
         # Add close button
         close_button = QPushButton()
-        close_button.setIcon(
-            self.style().standardIcon(self.style().StandardPixmap.SP_DialogCloseButton)
-        )
+        close_button.setObjectName("notificationClose")
+        close_button.setIcon(standard_icon(self, "SP_DialogCloseButton"))
         close_button.setFlat(True)
         close_button.setFixedSize(16, 16)
         close_button.clicked.connect(self.hide_animation)
         layout.addWidget(close_button)
 
+        self.setLayout(layout)
+
         # Set size policy
         self.setSizePolicy(
-            self.sizePolicy().horizontalPolicy(), self.sizePolicy().Fixed
+            self.sizePolicy().horizontalPolicy(), QSizePolicy.Policy.Fixed
         )
 
         # Style
-        bg_color, border_color, _ = self.colors[self.severity]
-        self.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {bg_color};
-                border: 1px solid {border_color};
-                border-radius: 4px;
-            }}
-            QLabel {{
-                background: transparent;
-                border: none;
-            }}
-            QPushButton {{
-                background: transparent;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background: rgba(0, 0, 0, 0.1);
-                border-radius: 2px;
-            }}
-        """
-        )
+        self.setStyleSheet(_NOTIFICATION_QSS[self.severity])
 
     def hide_animation(self):
         """Animate hiding the notification."""
-        self.hide()
-        self.deleteLater()
+        if self.is_closed:
+            return
+        self.is_closed = True
+        self.closed.emit()
+        self.close()
 
 
 class ErrorStateWidget(QWidget):
@@ -156,78 +223,51 @@ class ErrorStateWidget(QWidget):
         self.detail = detail
         self.can_retry = can_retry
 
-        # Setup UI
-        self.setup_ui()
+        # UI is built on first show
+        self._ui_built = False
+
+    def showEvent(self, event):
+        """Build the UI the first time the widget is shown."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        super().showEvent(event)
 
     def setup_ui(self):
         """Set up the error state UI."""
-        # Create layout
-        layout = QVBoxLayout(self)
+        # Create layout detached; it is attached once fully populated
+        layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.setSpacing(16)
 
         # Add icon
         icon_label = QLabel()
-        icon_label.setPixmap(
-            self.style()
-            .standardIcon(self.style().StandardPixmap.SP_MessageBoxCritical)
-            .pixmap(48, 48)
-        )
+        icon_label.setPixmap(standard_pixmap(self, "SP_MessageBoxCritical", 48, 48))
         layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignCenter)
 
         # Add message
         message_label = QLabel(self.message)
         message_label.setWordWrap(True)
-        message_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #D32F2F;
-            }
-        """
-        )
+        message_label.setStyleSheet(_ERROR_MESSAGE_QSS)
         layout.addWidget(message_label, 0, Qt.AlignmentFlag.AlignCenter)
 
         # Add detail if provided
         if self.detail:
             detail_label = QLabel(self.detail)
             detail_label.setWordWrap(True)
-            detail_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #757575;
-                }
-            """
-            )
+            detail_label.setStyleSheet(_ERROR_DETAIL_QSS)
             layout.addWidget(detail_label, 0, Qt.AlignmentFlag.AlignCenter)
 
         # Add retry button if enabled
         if self.can_retry:
             retry_button = QPushButton("Retry")
-            retry_button.setIcon(
-                self.style().standardIcon(self.style().StandardPixmap.SP_BrowserReload)
-            )
+            retry_button.setIcon(standard_icon(self, "SP_BrowserReload"))
             retry_button.clicked.connect(self.retryClicked)
-            retry_button.setStyleSheet(
-                """
-                QPushButton {
-                    padding: 8px 16px;
-                    background-color: #F44336;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #E53935;
-                }
-                QPushButton:pressed {
-                    background-color: #D32F2F;
-                }
-            """
-            )
+            retry_button.setStyleSheet(_RETRY_BUTTON_QSS)
             layout.addWidget(retry_button, 0, Qt.AlignmentFlag.AlignCenter)
 
+        self.setLayout(layout)
+
 
 class ErrorHandler(QObject):
     """Global error handler."""
@@ -237,6 +277,8 @@ class ErrorHandler(QObject):
 
     # Signals
     errorOccurred = pyqtSignal(str, ErrorSeverity)  # message, severity
+    # Internal: asks the GUI thread to schedule a flush of queued log records
+    _flushRequested = pyqtSignal()
 
     def __new__(cls):
         """Create or return singleton instance."""
@@ -249,7 +291,27 @@ class ErrorHandler(QObject):
         if not hasattr(self, "_initialized"):
             super().__init__()
             self._initialized = True
-            self._active_notifications: List[ErrorNotification] = []
+            # Shown notifications oldest first, with the vertical space each
+            # takes in the stack; _bottom_offset is their running total
+            self._active_notifications: Deque[Tuple[ErrorNotification, int]] = deque()
+            self._bottom_offset = 0
+
+            # Window notifications are shown on; found once, then cached
+            # until it is destroyed
+            self._main_window: Optional[QWidget] = None
+
+            # Log records waiting to be shown; filled from any thread and
+            # drained on the GUI thread in batches
+            self._pending_logs: "queue.SimpleQueue[Tuple[str, ErrorSeverity]]" = (
+                queue.SimpleQueue()
+            )
+            self._flush_pending = False
+            self._recently_shown: Dict[Tuple[str, ErrorSeverity], float] = {}
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(_LOG_FLUSH_DELAY_MS)
+            self._flush_timer.timeout.connect(self._flush_log_notifications)
+            self._flushRequested.connect(self._schedule_log_flush)
 
             # Set up logging handler
             self._setup_logging()
@@ -258,31 +320,136 @@ class ErrorHandler(QObject):
         """Set up logging handler to capture errors."""
 
         class UILogHandler(logging.Handler):
+            # Marks handlers installed by any import of this module
+            shows_ui_notifications = True
+
             def __init__(self, error_handler):
                 super().__init__()
                 self.error_handler = error_handler
 
             def emit(self, record):
                 try:
-                    # Map logging levels to severity
-                    severity_map = {
-                        logging.INFO: ErrorSeverity.INFO,
-                        logging.WARNING: ErrorSeverity.WARNING,
-                        logging.ERROR: ErrorSeverity.ERROR,
-                        logging.CRITICAL: ErrorSeverity.CRITICAL,
-                    }
-                    severity = severity_map.get(record.levelno, ErrorSeverity.ERROR)
-
-                    # Show notification for warning and above
-                    if record.levelno >= logging.WARNING:
-                        self.error_handler.show_notification(
-                            record.getMessage(), severity
-                        )
+                    severity = _SEVERITY_MAP.get(record.levelno, ErrorSeverity.ERROR)
+                    # May run on any thread; widgets are created later on
+                    # the GUI thread
+                    self.error_handler._queue_log_notification(
+                        record.getMessage(), severity
+                    )
                 except Exception:
                     pass  # Avoid infinite recursion
 
-        # Add handler to root logger
-        logging.getLogger().addHandler(UILogHandler(self))
+        root = logging.getLogger()
+        # Replace a handler left by an earlier import of this module so each
+        # record notifies once
+        for handler in root.handlers[:]:
+            if getattr(handler, "shows_ui_notifications", False):
+                root.removeHandler(handler)
+
+        # Add handler to root logger; only warning and above are shown, and
+        # the level check drops other records before emit() runs
+        self._ui_log_handler = UILogHandler(self)
+        self._ui_log_handler.setLevel(logging.WARNING)
+        root.addHandler(self._ui_log_handler)
+
+    def set_main_window(self, window: Optional[QWidget]):
+        """Set the window notifications are shown on.
+
+        Args:
+            window: Main window, or None to look it up again on demand
+        """
+        if window is self._main_window:
+            return
+        if self._main_window is not None:
+            try:
+                self._main_window.destroyed.disconnect(self._on_main_window_destroyed)
+            except (RuntimeError, TypeError):
+                pass
+        self._main_window = window
+        if window is not None:
+            window.destroyed.connect(self._on_main_window_destroyed)
+
+    @Slot()
+    def _on_main_window_destroyed(self):
+        """Forget the cached main window once Qt deletes it."""
+        self._main_window = None
+
+    def _get_main_window(self) -> Optional[QWidget]:
+        """Return the cached main window, scanning top-level widgets if unset."""
+        if self._main_window is None:
+            for widget in QApplication.topLevelWidgets():
+                if widget.isWindow():
+                    self.set_main_window(widget)
+                    break
+        return self._main_window
+
+    def _queue_log_notification(self, message: str, severity: ErrorSeverity):
+        """Queue a log-driven notification; safe to call from any thread."""
+        self._pending_logs.put((message, severity))
+        if not self._flush_pending:
+            self._flush_pending = True
+            # Queued onto the GUI thread when emitted from a worker
+            self._flushRequested.emit()
+
+    @Slot()
+    def _schedule_log_flush(self):
+        """Start the batching delay unless a flush is already scheduled."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def _flush_log_notifications(self):
+        """Show queued log records, collapsing duplicates and recent repeats."""
+        try:
+            self._flush_pending = False
+            counts: Dict[Tuple[str, ErrorSeverity], int] = {}
+            while True:
+                try:
+                    key = self._pending_logs.get_nowait()
+                except queue.Empty:
+                    break
+                counts[key] = counts.get(key, 0) + 1
+
+            now = time.monotonic()
+            self._recently_shown = {
+                key: shown_at
+                for key, shown_at in self._recently_shown.items()
+                if now - shown_at < _LOG_REPEAT_WINDOW_SEC
+            }
+            fresh = [
+                (key, count)
+                for key, count in counts.items()
+                if key not in self._recently_shown
+            ]
+
+            # Errors are always shown; the remaining slots go to the newest
+            # of the other messages, and whatever is dropped is summarized
+            urgent = sum(1 for key, _ in fresh if key[1] in _URGENT)
+            spare = max(_MAX_LOG_NOTIFICATIONS_PER_FLUSH - urgent, 0)
+            keep = []
+            for entry in reversed(fresh):
+                if entry[0][1] in _URGENT:
+                    keep.append(entry)
+                elif spare:
+                    keep.append(entry)
+                    spare -= 1
+            keep.reverse()
+
+            for key, count in keep:
+                self._recently_shown[key] = now
+                message, severity = key
+                if count > 1:
+                    message = f"{message} (x{count})"
+                self.show_notification(message, severity)
+
+            dropped = len(fresh) - len(keep)
+            if dropped:
+                self.show_notification(
+                    f"+{dropped} more log message{'s' if dropped > 1 else ''}",
+                    ErrorSeverity.WARNING,
+                )
+
+        except Exception as e:
+            logger.error(f"Error flushing log notifications: {e}", exc_info=True)
 
     def show_notification(
         self,
@@ -293,12 +460,7 @@ class ErrorHandler(QObject):
         """Show error notification."""
         try:
             # Get main window
-            main_window = None
-            for widget in QApplication.topLevelWidgets():
-                if widget.isWindow():
-                    main_window = widget
-                    break
-
+            main_window = self._get_main_window()
             if not main_window:
                 return
 
@@ -312,12 +474,10 @@ class ErrorHandler(QObject):
             notification.show()
 
             # Add to active notifications
-            self._active_notifications.append(notification)
-
-            # Clean up hidden notifications
-            self._active_notifications = [
-                n for n in self._active_notifications if not n.isHidden()
-            ]
+            height = notification.height() + 10
+            self._active_notifications.append((notification, height))
+            self._bottom_offset += height
+            notification.closed.connect(partial(self._on_notification_closed, height))
 
             # Emit signal
             self.errorOccurred.emit(message, severity)
@@ -325,23 +485,23 @@ class ErrorHandler(QObject):
         except Exception as e:
             logger.error(f"Error showing notification: {e}", exc_info=True)
 
+    def _on_notification_closed(self, height: int):
+        """Release a closed notification's space in the stack."""
+        self._bottom_offset -= height
+        # Drop closed notifications from the front; most close in order
+        while self._active_notifications and self._active_notifications[0][0].is_closed:
+            self._active_notifications.popleft()
+
     def _position_notification(self, notification: ErrorNotification):
         """Position notification widget."""
         try:
-            if not notification.parentWidget():
+            parent = notification.parentWidget()
+            if not parent:
                 return
 
-            # Get parent geometry
-            parent_rect = notification.parentWidget().geometry()
-
-            # Calculate initial position (bottom-right corner)
-            x = parent_rect.width() - notification.sizeHint().width() - 20
-            y = parent_rect.height() - 20
-
-            # Adjust for existing notifications
-            for n in reversed(self._active_notifications):
-                if not n.isHidden():
-                    y -= n.height() + 10
+            # Bottom-right corner, above the notifications already shown
+            x = parent.width() - notification.sizeHint().width() - 20
+            y = parent.height() - 20 - self._bottom_offset
 
             # Set position
             notification.move(x, y)
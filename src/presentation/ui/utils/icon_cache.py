@@ -0,0 +1,48 @@
+"""Shared cache for Qt standard icons and their pixmaps."""
+
+from typing import Dict
+
+from PySide6.QtGui import QIcon, QPixmap, QPixmapCache
+from PySide6.QtWidgets import QStyle, QWidget
+
+# Standard icons are rendered by the style on every request, so keep the
+# results for the lifetime of the application. Rendered pixmaps go into Qt's
+# QPixmapCache instead, which bounds their memory and is shared app-wide.
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+
+def standard_icon(widget: QWidget, name: str) -> QIcon:
+    """Return the style's standard icon ``name`` (e.g. ``"SP_FileIcon"``).
+
+    Args:
+        widget: Widget whose style provides the icon on a cache miss
+        name: QStyle.StandardPixmap member name
+
+    Returns:
+        QIcon: Cached icon
+    """
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = widget.style().standardIcon(getattr(QStyle.StandardPixmap, name))
+        _ICON_CACHE[name] = icon
+    return icon
+
+
+def standard_pixmap(widget: QWidget, name: str, width: int, height: int) -> QPixmap:
+    """Return the standard icon ``name`` rendered at ``width`` x ``height``.
+
+    Args:
+        widget: Widget whose style provides the icon on a cache miss
+        name: QStyle.StandardPixmap member name
+        width: Pixmap width
+        height: Pixmap height
+
+    Returns:
+        QPixmap: Cached pixmap
+    """
+    key = f"std:{name}:{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = standard_icon(widget, name).pixmap(width, height)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
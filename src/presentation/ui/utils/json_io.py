@@ -0,0 +1,63 @@
+"""JSON helpers for presentation-layer stores with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from raw file bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_file(path: str) -> Any:
+    """Load and parse a JSON file.
+
+    Parses are not cached here; stores that reread a file keep their own
+    cache keyed by file_stamp.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write data to a sibling temp file and rename it over path.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one that would be replaced with defaults on next start. The
+    data is fsynced before the rename so the new file is never empty after
+    a power loss.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -1,27 +1,56 @@
 """Loading state utilities."""
 
-from PySide6.QtCore import Qt, QTimer, QSize
+from PySide6.QtCore import Qt, QEvent, QTimer, QSize
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QProgressBar, QSizePolicy
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtGui import QPainter, QColor, QPen, QPixmap
+from typing import Dict, List, Optional, Tuple
 import math
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Rotation steps of 30 degrees per spinner revolution
+_SPINNER_STEPS = 12
+
+# Stylesheets shared by all loading widgets instead of rebuilt per instance
+_MESSAGE_QSS = """
+QLabel {
+    color: #757575;
+    font-size: 14px;
+}
+"""
+_OVERLAY_QSS = """
+LoadingOverlay {
+    background-color: rgba(255, 255, 255, 0.8);
+}
+"""
+
+# Shared size policy; setSizePolicy copies it, so one instance serves all widgets
+_EXPANDING = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
 
 class SpinnerWidget(QWidget):
-    """Custom loading spinner widget."""
+    """Custom loading spinner widget.
+
+    The 12 rotation frames are rendered once per size and color, and one
+    shared timer advances every visible spinner.
+    """
+
+    # (size, color, device pixel ratio) -> pre-rendered rotation frames
+    _frame_cache: Dict[Tuple[int, str, float], List[QPixmap]] = {}
+    # Visible spinners driven by the shared timer
+    _visible: "weakref.WeakSet[SpinnerWidget]" = weakref.WeakSet()
+    _timer: Optional[QTimer] = None
+    _frame_index = 0
 
     def __init__(self, parent=None, size=40, color="#2196F3"):
         """Initialize spinner widget."""
         super().__init__(parent)
 
-        self.angle = 0
         self.size = size
         self.color = QColor(color)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._rotate)
-        self.timer.start(50)  # 20 FPS
+        self._frames: List[QPixmap] = []
 
         # Set size
         self.setFixedSize(size, size)
@@ -29,64 +58,88 @@ class SpinnerWidget(QWidget):
         # Set background transparent
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-    def _rotate(self):
-        """Update rotation angle."""
-        self.angle = (self.angle + 30) % 360
-        self.update()
-
-    def paintEvent(self, event):
-        """Paint the spinner."""
-        try:
-            painter = QPainter(self)
+    @classmethod
+    def _render_frames(cls, size: int, color: QColor, ratio: float) -> List[QPixmap]:
+        """Return the rotation frames for a spinner, rendering them once."""
+        key = (size, color.name(QColor.NameFormat.HexArgb), ratio)
+        frames = cls._frame_cache.get(key)
+        if frames is not None:
+            return frames
+
+        # Pens for the 12 arcs with varying opacity, shared by every frame
+        pens = []
+        for i in range(_SPINNER_STEPS):
+            opacity = 1.0 - (i / _SPINNER_STEPS)
+            pen = QPen(
+                QColor(color.red(), color.green(), color.blue(), int(255 * opacity))
+            )
+            pen.setWidth(2)
+            pens.append(pen)
+
+        frames = []
+        span_angle = 20 * 16  # Qt uses 1/16th of a degree
+        for step in range(_SPINNER_STEPS):
+            pixmap = QPixmap(round(size * ratio), round(size * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-            # Calculate center and radius
-            center = self.rect().center()
-            radius = (min(self.width(), self.height()) - 4) / 2
-
-            # Draw arcs with varying opacity
-            for i in range(12):
-                # Calculate angle and opacity
-                angle = (self.angle - i * 30) % 360
-                opacity = 1.0 - (i / 12)
-
-                # Set pen
-                pen = QPen(
-                    QColor(
-                        self.color.red(),
-                        self.color.green(),
-                        self.color.blue(),
-                        int(255 * opacity),
-                    )
-                )
-                pen.setWidth(2)
+            for i, pen in enumerate(pens):
+                angle = (step * 30 - i * 30) % 360
                 painter.setPen(pen)
+                painter.drawArc(2, 2, size - 4, size - 4, angle * 16, span_angle)
+            painter.end()
+            frames.append(pixmap)
+
+        cls._frame_cache[key] = frames
+        return frames
+
+    @classmethod
+    def _advance(cls):
+        """Move every visible spinner to the next frame."""
+        cls._frame_index = (cls._frame_index + 1) % _SPINNER_STEPS
+        for spinner in list(cls._visible):
+            try:
+                spinner.update()
+            except RuntimeError:
+                # Underlying widget already deleted
+                cls._visible.discard(spinner)
+        if not cls._visible:
+            cls._timer.stop()
 
-                # Draw arc
-                start_angle = angle * 16  # Qt uses 1/16th of a degree
-                span_angle = 20 * 16
-                painter.drawArc(
-                    2, 2, self.width() - 4, self.height() - 4, start_angle, span_angle
-                )
-
-        except Exception as e:
-            logger.error(f"Error painting spinner: {e}", exc_info=True)
+    def paintEvent(self, event):
+        """Paint the spinner."""
+        if not self._frames:
+            self._frames = self._render_frames(
+                self.size, self.color, self.devicePixelRatioF()
+            )
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._frames[SpinnerWidget._frame_index])
+        painter.end()
 
     def showEvent(self, event):
         """Handle show event."""
-        try:
-            self.timer.start()
-            super().showEvent(event)
-        except Exception as e:
-            logger.error(f"Error showing spinner: {e}", exc_info=True)
+        cls = SpinnerWidget
+        cls._visible.add(self)
+        if cls._timer is None:
+            cls._timer = QTimer()
+            cls._timer.setInterval(50)  # 20 FPS
+            cls._timer.timeout.connect(cls._advance)
+        if not cls._timer.isActive():
+            cls._timer.start()
+        super().showEvent(event)
 
     def hideEvent(self, event):
         """Handle hide event."""
-        try:
-            self.timer.stop()
-            super().hideEvent(event)
-        except Exception as e:
-            logger.error(f"Error hiding spinner: {e}", exc_info=True)
+        cls = SpinnerWidget
+        cls._visible.discard(self)
+        if not cls._visible and cls._timer is not None:
+            try:
+                cls._timer.stop()
+            except RuntimeError:
+                # Shared timer already deleted at interpreter shutdown
+                cls._timer = None
+        super().hideEvent(event)
 
 
 class LoadingStateWidget(QWidget):
@@ -100,45 +153,50 @@ class LoadingStateWidget(QWidget):
         spinner_color: str = "#2196F3",
     ):
         """Initialize loading state widget."""
-        try:
-            super().__init__(parent)
-
-            # Create layout
-            layout = QVBoxLayout(self)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setSpacing(16)
-
-            # Add spinner
-            self.spinner = SpinnerWidget(self, spinner_size, spinner_color)
-            layout.addWidget(self.spinner, 0, Qt.AlignmentFlag.AlignCenter)
-
-            # Add message
-            self.message_label = QLabel(message)
-            self.message_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #757575;
-                    font-size: 14px;
-                }
-            """
-            )
-            layout.addWidget(self.message_label, 0, Qt.AlignmentFlag.AlignCenter)
+        super().__init__(parent)
 
-            # Set size policy
-            self.setSizePolicy(
-                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-            )
+        self.message = message
+        self.spinner_size = spinner_size
+        self.spinner_color = spinner_color
+        # Spinner and label are created on first show
+        self.spinner: Optional[SpinnerWidget] = None
+        self.message_label: Optional[QLabel] = None
 
-            logger.debug("Loading state widget initialized")
+        # Set size policy
+        self.setSizePolicy(_EXPANDING)
 
-        except Exception as e:
-            logger.error(f"Error initializing loading state: {e}", exc_info=True)
-            raise
+        logger.debug("Loading state widget initialized")
+
+    def setup_ui(self):
+        """Set up the loading state UI."""
+        # Create layout detached; it is attached once fully populated
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setSpacing(16)
+
+        # Add spinner
+        self.spinner = SpinnerWidget(self, self.spinner_size, self.spinner_color)
+        layout.addWidget(self.spinner, 0, Qt.AlignmentFlag.AlignCenter)
+
+        # Add message
+        self.message_label = QLabel(self.message)
+        self.message_label.setStyleSheet(_MESSAGE_QSS)
+        layout.addWidget(self.message_label, 0, Qt.AlignmentFlag.AlignCenter)
+
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        """Build the UI the first time the widget is shown."""
+        if self.message_label is None:
+            self.setup_ui()
+        super().showEvent(event)
 
     def set_message(self, message: str):
         """Update loading message."""
         try:
-            self.message_label.setText(message)
+            self.message = message
+            if self.message_label is not None:
+                self.message_label.setText(message)
         except Exception as e:
             logger.error(f"Error setting message: {e}", exc_info=True)
 
@@ -154,45 +212,50 @@ class LoadingOverlay(QWidget):
         spinner_color: str = "#2196F3",
     ):
         """Initialize loading overlay."""
-        try:
-            super().__init__(parent)
+        super().__init__(parent)
+
+        # Set up overlay properties
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
 
-            # Set up overlay properties
-            self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-            self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        # Create loading state widget
+        self.loading_widget = LoadingStateWidget(
+            message, self, spinner_size, spinner_color
+        )
 
-            # Create loading state widget
-            self.loading_widget = LoadingStateWidget(
-                message, self, spinner_size, spinner_color
-            )
+        # Create layout
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.loading_widget)
 
-            # Create layout
-            layout = QVBoxLayout(self)
-            layout.addWidget(self.loading_widget)
-
-            # Style
-            self.setStyleSheet(
-                """
-                LoadingOverlay {
-                    background-color: rgba(255, 255, 255, 0.8);
-                }
-            """
-            )
+        # Style
+        self.setStyleSheet(_OVERLAY_QSS)
 
-            # Hide initially
-            self.hide()
+        # Hide initially
+        self.hide()
 
-            logger.debug("Loading overlay initialized")
+        # Follow parent resizes while visible instead of only on show
+        if parent is not None:
+            parent.installEventFilter(self)
 
-        except Exception as e:
-            logger.error(f"Error initializing loading overlay: {e}", exc_info=True)
-            raise
+        logger.debug("Loading overlay initialized")
+
+    def eventFilter(self, watched, event):
+        """Keep a visible overlay sized to its parent."""
+        if (
+            event.type() == QEvent.Type.Resize
+            and watched is self.parentWidget()
+            and self.isVisible()
+        ):
+            self.resize(event.size())
+        return super().eventFilter(watched, event)
 
     def showEvent(self, event):
         """Handle show event."""
         try:
-            if self.parentWidget():
-                self.resize(self.parentWidget().size())
+            # Catch up with parent resizes that happened while hidden
+            parent = self.parentWidget()
+            if parent and self.size() != parent.size():
+                self.resize(parent.size())
             super().showEvent(event)
         except Exception as e:
             logger.error(f"Error showing overlay: {e}", exc_info=True)
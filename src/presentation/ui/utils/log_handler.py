@@ -1,8 +1,9 @@
 """Qt logging handler for system log layout."""
 
 import logging
+import time
 from typing import Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
 
 class QtSignalEmitter(QObject):
@@ -11,6 +12,34 @@ class QtSignalEmitter(QObject):
     log_message = Signal(str, int)  # Signal for log messages (message, level)
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted asctime within the same second."""
+
+    def __init__(self, fmt: Optional[str] = None):
+        """Initialize the formatter.
+
+        Args:
+            fmt: Log record format string
+        """
+        super().__init__(fmt)
+        # (whole second, formatted time); one tuple so threads never see a
+        # second paired with another second's text
+        self._cached_time = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+        """Format the record time, formatting each second only once."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, text)
+        if self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
+
+
 class QtLogHandler(logging.Handler):
     """Custom logging handler that emits Qt signals."""
 
@@ -19,8 +48,11 @@ class QtLogHandler(logging.Handler):
         super().__init__()
         # Create separate signal emitter removing - %(name)s
         self.signal_emitter = QtSignalEmitter()
+        # Number of connected widget slots; records are dropped unformatted
+        # while nothing is listening (e.g. the dashboard is closed)
+        self._connections = 0
         self.setFormatter(
-            logging.Formatter("%(asctime)s- %(levelname)s  - %(message)s")
+            _CachedTimeFormatter("%(asctime)s- %(levelname)s  - %(message)s")
         )
 
     def emit(self, record: logging.LogRecord) -> None:
@@ -29,6 +61,8 @@ class QtLogHandler(logging.Handler):
         Args:
             record: The logging record to emit
         """
+        if not self._connections:
+            return
         try:
             # Format the message
             msg = self.format(record)
@@ -42,14 +76,21 @@ class QtLogHandler(logging.Handler):
                 pass
             self.handleError(record)
 
-    def connect_to_widget(self, slot) -> None:
+    def connect_to_widget(
+        self,
+        slot,
+        connection_type: Qt.ConnectionType = Qt.ConnectionType.AutoConnection,
+    ) -> None:
         """Connect the log handler to a widget's slot.
 
         Args:
             slot: The slot function to connect to
+            connection_type: Qt connection type; use DirectConnection only
+                for thread-safe slots
         """
         try:
-            self.signal_emitter.log_message.connect(slot)
+            self.signal_emitter.log_message.connect(slot, connection_type)
+            self._connections += 1
         except Exception as e:
             print(f"Error connecting log handler: {e}")
 
@@ -61,5 +102,6 @@ class QtLogHandler(logging.Handler):
         """
         try:
             self.signal_emitter.log_message.disconnect(slot)
+            self._connections = max(0, self._connections - 1)
         except Exception as e:
             print(f"Error disconnecting log handler: {e}")
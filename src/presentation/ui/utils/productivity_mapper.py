@@ -87,11 +87,9 @@ class ProductivityMapper:
                 logger.warning(f"Invalid daily trends length: {len(daily_trends)}")
                 daily_trends = [0.0] * 7
 
-            # Create heatmap data
-            heatmap_data = np.zeros((7, 24))
-            for day in range(7):
-                for hour in range(24):
-                    heatmap_data[day, hour] = hourly_trends[hour]
+            # Create heatmap data: every day row repeats the hourly trends
+            hourly = np.fromiter(hourly_trends, dtype=np.float64, count=24)
+            heatmap_data = np.tile(hourly, (7, 1))
 
             return {
                 "hourly_trends": hourly_trends,
@@ -124,23 +122,22 @@ class ProductivityMapper:
             if not isinstance(categories, dict):
                 raise ValueError(f"Invalid categories type: {type(categories)}")
 
-            category_data = {}
-            total_time = sum(
-                cat.get("duration", 0)
-                for cat in categories.values()
-                if isinstance(cat, dict)
-            )
+            # One pass over the report collects the values and the total
+            items = [
+                (name, data.get("duration", 0), data.get("productivity_score", 0.0))
+                for name, data in categories.items()
+                if isinstance(data, dict)
+            ]
+            total_time = sum(item[1] for item in items)
 
-            for name, data in categories.items():
-                if not isinstance(data, dict):
-                    continue
-
-                duration = data.get("duration", 0)
-                category_data[name] = {
+            category_data = {
+                name: {
                     "duration": duration,
                     "percentage": duration / total_time if total_time > 0 else 0,
-                    "productivity_score": data.get("productivity_score", 0.0),
+                    "productivity_score": score,
                 }
+                for name, duration, score in items
+            }
 
             return {
                 "categories": category_data,
@@ -26,6 +26,13 @@ class ServiceConnector:
             suggestion_service=suggestion_service,
         )
 
+    def close(self) -> None:
+        """Release background resources held by the data manager."""
+        try:
+            self.data_manager.close()
+        except Exception as e:
+            logger.error(f"Error closing data manager: {e}", exc_info=True)
+
     def get_dashboard_data(self, time_window: timedelta) -> Dict[str, Any]:
         """Get all data needed for dashboard display.
 
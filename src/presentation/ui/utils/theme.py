@@ -1,9 +1,7 @@
 """Theme utilities for modern solid-color UI styling."""
 
-
-def get_stylesheet() -> str:
-    # Solid, modern theme with dark side panel and light content
-    return """
+# Solid, modern theme with dark side panel and light content
+_STYLESHEET = """
     QMainWindow {
         background-color: #f3f4f6;
     }
@@ -87,5 +85,12 @@ def get_stylesheet() -> str:
     """
 
 
+def get_stylesheet() -> str:
+    return _STYLESHEET
+
+
 def apply_theme(app) -> None:
-    app.setStyleSheet(get_stylesheet())
+    # Setting the sheet again would make Qt repolish every widget for nothing
+    if app.styleSheet() == _STYLESHEET:
+        return
+    app.setStyleSheet(_STYLESHEET)
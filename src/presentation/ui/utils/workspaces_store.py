@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import os
 import uuid
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+from . import json_io
 
 
 @dataclass
@@ -54,82 +56,134 @@ class WorkspacesStore:
         self.base_dir = base_dir
         os.makedirs(self.base_dir, exist_ok=True)
         self._path = os.path.join(self.base_dir, "workspaces.json")
+        # Valid workspace rows with the file stamp they were read at, so
+        # operations that look up and then write read the file only once
+        self._loaded: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+        # Lookup tables over the cached rows: id -> row, lowercased name -> row
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        # Stamp and bytes of the last write, to skip rewriting identical data
+        self._written: Optional[Tuple[Optional[Tuple[int, int]], bytes]] = None
         if not os.path.exists(self._path):
             self._write({"workspaces": []})
 
-    def _read(self) -> Dict[str, Any]:
+    @staticmethod
+    def _valid_rows(rows: Any) -> List[Dict[str, Any]]:
+        """Return the rows that form a WorkspaceRecord, dropping the rest."""
+        valid: List[Dict[str, Any]] = []
+        for w in rows if isinstance(rows, list) else []:
+            try:
+                WorkspaceRecord(**w)
+            except Exception:
+                continue
+            valid.append(w)
+        return valid
+
+    def _cache_rows(
+        self, stamp: Optional[Tuple[int, int]], rows: List[Dict[str, Any]]
+    ) -> None:
+        """Cache rows read or written at stamp and index them."""
+        self._loaded = (stamp, rows) if stamp is not None else None
+        self._by_id = {}
+        self._by_name = {}
+        # setdefault keeps the first match, as the linear scans did
+        for w in rows:
+            if isinstance(w["id"], str):
+                self._by_id.setdefault(w["id"], w)
+            if isinstance(w["name"], str):
+                self._by_name.setdefault(w["name"].strip().lower(), w)
+
+    def _rows(self) -> List[Dict[str, Any]]:
+        """Return the stored workspace rows.
+
+        The rows are shared with the cache and must not be mutated; public
+        methods hand out copies.
+        """
+        stamp = json_io.file_stamp(self._path)
+        if stamp is None:
+            self._cache_rows(None, [])
+            return []
+        if self._loaded is not None and self._loaded[0] == stamp:
+            return self._loaded[1]
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                return json.load(f) or {"workspaces": []}
+            data = json_io.load_file(self._path) or {}
+            rows = self._valid_rows(data.get("workspaces", []))
         except Exception:
-            return {"workspaces": []}
+            rows = []
+        self._cache_rows(stamp, rows)
+        return rows
+
+    def _find(self, rec_id: str) -> Optional[Dict[str, Any]]:
+        self._rows()
+        return self._by_id.get(rec_id)
 
     def _write(self, data: Dict[str, Any]) -> None:
-        os.makedirs(self.base_dir, exist_ok=True)
-        with open(self._path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        payload = json_io.dumps(data)
+        stamp = json_io.file_stamp(self._path)
+        if self._written != (stamp, payload):
+            os.makedirs(self.base_dir, exist_ok=True)
+            json_io.atomic_write(self._path, payload)
+            stamp = json_io.file_stamp(self._path)
+            self._written = (stamp, payload)
+        # The written rows are owned by the store, so they become the cache
+        self._cache_rows(stamp, self._valid_rows(data.get("workspaces", [])))
 
     def list(self) -> List[WorkspaceRecord]:
-        data = self._read()
-        recs: List[WorkspaceRecord] = []
-        for w in data.get("workspaces", []):
-            try:
-                recs.append(WorkspaceRecord(**w))
-            except Exception:
-                continue
-        return recs
+        """Return all workspaces as a read-only view.
+
+        Each record's ``apps`` is shared with the store's cache rather than
+        copied; change workspaces through update(), which copies on write.
+        Use get() for a record that is safe to mutate.
+        """
+        return [WorkspaceRecord(**w) for w in self._rows()]
 
     def save_new(
         self, name: str, apps: List[Dict[str, Any]], template: bool = False
     ) -> WorkspaceRecord:
         rec = WorkspaceRecord.new(name=name, apps=apps, template=template)
-        all_ws = self.list()
-        all_ws.append(rec)
-        self._write({"workspaces": [asdict(w) for w in all_ws]})
+        self._write({"workspaces": self._rows() + [asdict(rec)]})
         return rec
 
     def update(self, rec_id: str, **fields) -> Optional[WorkspaceRecord]:
-        all_ws = self.list()
-        updated = None
+        # One snapshot for both the lookup and the write, so a file change in
+        # between cannot drop the edit
+        all_ws = self._rows()
         for i, w in enumerate(all_ws):
-            if w.id == rec_id:
+            if w["id"] == rec_id:
+                updated = WorkspaceRecord(**w)
                 for k, v in fields.items():
-                    if hasattr(w, k):
-                        setattr(w, k, v)
-                w.updated_at = datetime.now().isoformat(timespec="seconds")
-                all_ws[i] = w
-                updated = w
-                break
-        if updated:
-            self._write({"workspaces": [asdict(w) for w in all_ws]})
-        return updated
+                    if hasattr(updated, k):
+                        setattr(updated, k, v)
+                updated.updated_at = datetime.now().isoformat(timespec="seconds")
+                new_ws = all_ws[:i] + [asdict(updated)] + all_ws[i + 1 :]
+                self._write({"workspaces": new_ws})
+                return updated
+        return None
 
     def delete(self, rec_id: str) -> bool:
-        all_ws = self.list()
-        new_ws = [w for w in all_ws if w.id != rec_id]
+        all_ws = self._rows()
+        new_ws = [w for w in all_ws if w["id"] != rec_id]
         if len(new_ws) == len(all_ws):
             return False
-        self._write({"workspaces": [asdict(w) for w in new_ws]})
+        self._write({"workspaces": new_ws})
         return True
 
     def duplicate(self, rec_id: str, new_name: str) -> Optional[WorkspaceRecord]:
-        w = self.get(rec_id)
+        w = self._find(rec_id)
         if not w:
             return None
-        return self.save_new(new_name, apps=w.apps, template=w.template)
+        return self.save_new(
+            new_name, apps=copy.deepcopy(w["apps"]), template=w["template"]
+        )
 
     def get(self, rec_id: str) -> Optional[WorkspaceRecord]:
-        for w in self.list():
-            if w.id == rec_id:
-                return w
-        return None
+        w = self._find(rec_id)
+        return WorkspaceRecord(**copy.deepcopy(w)) if w else None
 
     def find_by_name(self, name: str) -> Optional[WorkspaceRecord]:
-        name_lower = (name or "").strip().lower()
-        for w in self.list():
-            if w.name.strip().lower() == name_lower:
-                return w
-        return None
+        self._rows()
+        w = self._by_name.get((name or "").strip().lower())
+        return WorkspaceRecord(**copy.deepcopy(w)) if w else None
 
     def set_favorite(self, rec_id: str, favorite: bool) -> Optional[WorkspaceRecord]:
         return self.update(rec_id, favorite=favorite)
@@ -140,16 +194,16 @@ class WorkspacesStore:
     # Export/Import
     def export_to(self, file_path: str) -> int:
         """Export all workspaces to a JSON file. Returns count exported."""
-        ws = [asdict(w) for w in self.list()]
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump({"workspaces": ws}, f, indent=2)
+        ws = self._rows()
+        with open(file_path, "wb") as f:
+            f.write(json_io.dumps({"workspaces": ws}))
         return len(ws)
 
     def import_from(self, file_path: str, merge: bool = True) -> int:
         """Import workspaces from file. If merge, appends; else replaces. Returns count imported."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f) or {}
+            with open(file_path, "rb") as f:
+                data = json_io.loads(f.read()) or {}
         except Exception:
             return 0
         imported = data.get("workspaces", [])
@@ -159,8 +213,7 @@ class WorkspacesStore:
             self._write({"workspaces": imported})
             return len(imported)
         # merge
-        current = [asdict(w) for w in self.list()]
-        current.extend(imported)
+        current = self._rows() + imported
         # optional: de-dup by (name, apps signature)
         self._write({"workspaces": current})
         return len(imported)
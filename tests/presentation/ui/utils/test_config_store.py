@@ -0,0 +1,135 @@
+"""Tests for the presentation-layer ConfigStore."""
+
+import json
+import os
+
+import pytest
+
+from src.presentation.ui.utils import json_io
+from src.presentation.ui.utils.config_store import (
+    DEFAULT_CATEGORIES,
+    AppMapping,
+    ConfigStore,
+)
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Create a config store in an empty directory."""
+    return ConfigStore(base_dir=os.path.join(temp_dir, "config"))
+
+
+@pytest.fixture
+def write_calls(monkeypatch):
+    """Record the paths written through json_io.atomic_write."""
+    calls = []
+    real_write = json_io.atomic_write
+
+    def recording_write(path, data):
+        calls.append(path)
+        real_write(path, data)
+
+    monkeypatch.setattr(json_io, "atomic_write", recording_write)
+    return calls
+
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def test_load_categories_writes_defaults(store):
+    """Test a missing categories file is created with the defaults."""
+    assert store.load_categories() == DEFAULT_CATEGORIES
+
+    with open(os.path.join(store.base_dir, "categories.json"), "rb") as f:
+        assert json_io.loads(f.read()) == {"categories": DEFAULT_CATEGORIES}
+
+
+def test_load_categories_returns_copies(store):
+    """Test callers cannot mutate the cached categories."""
+    store.save_categories(["Work", "Play"])
+    store.load_categories().append("Other")
+
+    assert store.load_categories() == ["Work", "Play"]
+
+
+def test_load_mappings_skips_invalid_rows(store):
+    """Test mappings without an executable or name are dropped."""
+    os.makedirs(store.base_dir)
+    _write_json(
+        os.path.join(store.base_dir, "app_mappings.json"),
+        {
+            "mappings": [
+                {"executable": "Code.exe", "name": "VS Code", "category": ""},
+                {"executable": "", "name": "Nameless"},
+                {"executable": "orphan.exe", "name": None},
+            ]
+        },
+    )
+
+    assert store.load_mappings() == [
+        AppMapping(executable="Code.exe", name="VS Code", category="Unknown")
+    ]
+    assert store.mapping_lookup() == {"code.exe": ("VS Code", "Unknown")}
+
+
+def test_mapping_lookup_cached_until_file_changes(store):
+    """Test the lookup table is reused until the file is edited."""
+    store.save_mappings([AppMapping("a.exe", "A", "Development")])
+    table = store.mapping_lookup()
+    assert store.mapping_lookup() is table
+
+    _write_json(
+        os.path.join(store.base_dir, "app_mappings.json"),
+        {"mappings": [{"executable": "bb.exe", "name": "BB", "category": "System"}]},
+    )
+
+    assert store.mapping_lookup() == {"bb.exe": ("BB", "System")}
+
+
+def test_save_skips_unchanged_payload(store, write_calls):
+    """Test saving the same categories twice writes the file once."""
+    store.save_categories(["Work"])
+    store.save_categories(["Work", " "])
+
+    assert len(write_calls) == 1
+
+
+def test_save_overwrites_external_edit(store, write_calls):
+    """Test a save is not skipped once the file was changed externally."""
+    path = os.path.join(store.base_dir, "categories.json")
+    store.save_categories(["Work"])
+    _write_json(path, {"categories": ["Edited elsewhere"]})
+
+    store.save_categories(["Work"])
+
+    assert len(write_calls) == 2
+    assert store.load_categories() == ["Work"]
+
+
+def test_read_only_directory_falls_back_to_defaults(store, monkeypatch):
+    """Test loads still succeed when the defaults cannot be written."""
+
+    def failing_write(path, data):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(json_io, "atomic_write", failing_write)
+
+    assert store.load_categories() == DEFAULT_CATEGORIES
+    assert store.load_mappings() == []
+    assert store.mapping_lookup() == {}
+    assert not os.path.exists(os.path.join(store.base_dir, "categories.json"))
+
+
+def test_read_only_directory_with_empty_categories(store, monkeypatch):
+    """Test an empty categories file falls back without raising."""
+    os.makedirs(store.base_dir)
+    _write_json(os.path.join(store.base_dir, "categories.json"), {"categories": []})
+
+    def failing_write(path, data):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(json_io, "atomic_write", failing_write)
+
+    assert store.load_categories() == DEFAULT_CATEGORIES
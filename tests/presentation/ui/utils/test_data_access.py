@@ -0,0 +1,195 @@
+"""Tests for the presentation-layer DataAccessManager."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.presentation.ui.utils.data_access import DataAccessManager
+
+
+@pytest.fixture
+def services():
+    """Create mock analytics, session and suggestion services."""
+    return SimpleNamespace(
+        analytics=MagicMock(), session=MagicMock(), suggestion=MagicMock()
+    )
+
+
+@pytest.fixture
+def manager(services, temp_dir, monkeypatch):
+    """Create a manager whose config store lives in a temp directory."""
+    monkeypatch.chdir(temp_dir)
+    manager = DataAccessManager(
+        analytics_service=services.analytics,
+        session_service=services.session,
+        suggestion_service=services.suggestion,
+        retry_delay=0,
+        max_retry_delay=0,
+    )
+    yield manager
+    manager.close()
+
+
+def _activity(app_name, exe, start, active, idle):
+    return SimpleNamespace(
+        id=f"{app_name}-{start:%H%M}",
+        app_name=app_name,
+        window_title="Window",
+        start_time=start,
+        end_time=start + timedelta(minutes=5),
+        active_time=active,
+        idle_time=idle,
+        executable_path=exe,
+    )
+
+
+def test_get_activities_maps_rows_and_totals(manager, services):
+    """Test object and dict activities become UI rows with totals."""
+    start = datetime(2024, 1, 1, 9, 30)
+    services.session.repository.get_by_timerange.return_value = [
+        _activity("code", "C:\\Apps\\Code.exe", start, 120.0, 30.0),
+        _activity(None, "", start, 10, "5"),
+        {
+            "id": "d1",
+            "app_name": "chrome.exe",
+            "window_title": "Docs",
+            "start_time": "2024-01-01T10:00:00",
+            "end_time": "not a date",
+            "active_time": None,
+            "idle_time": 4,
+            "executable_path": "",
+        },
+    ]
+
+    result = manager.get_activities(timedelta(hours=2))
+
+    rows = result["list"]
+    assert [r["display_name"] for r in rows] == ["Code.exe", "", "chrome.exe"]
+    assert {r["category"] for r in rows} == {"Unknown"}
+    assert rows[1]["app_name"] is None
+    assert rows[0]["start_time"] == "2024-01-01 09:30:00"
+    assert rows[2]["start_time"] == "2024-01-01 10:00:00"
+    assert rows[2]["end_time"] == "N/A"
+    assert [r["total_time"] for r in rows] == [150.0, 15.0, 4.0]
+    assert result["total_active_time"] == 130.0
+    assert result["total_idle_time"] == 39.0
+    assert result["total_time"] == 169.0
+
+    limited = manager.get_activities(timedelta(hours=2), limit=1)
+    assert len(limited["list"]) == 1 and limited["total_time"] == 150.0
+
+
+def test_get_activities_picks_up_mapping_changes(manager, services):
+    """Test edited app mappings apply on the next query."""
+    start = datetime(2024, 1, 1, 9)
+    services.session.repository.get_by_timerange.return_value = [
+        _activity("code", "/usr/bin/code", start, 1.0, 0.0)
+    ]
+    assert manager.get_activities(timedelta(hours=1))["list"][0]["category"] == (
+        "Unknown"
+    )
+
+    with open(os.path.join("data", "config", "app_mappings.json"), "w") as f:
+        json.dump(
+            {
+                "mappings": [
+                    {
+                        "executable": "code",
+                        "name": "VS Code",
+                        "category": "Development",
+                    }
+                ]
+            },
+            f,
+        )
+
+    row = manager.get_activities(timedelta(hours=1))["list"][0]
+    assert (row["display_name"], row["category"]) == ("VS Code", "Development")
+
+
+def test_hourly_distribution_has_every_hour(manager, services):
+    """Test all 24 hours are reported, including empty ones."""
+    day = datetime(2024, 1, 1)
+    services.analytics.get_productivity_report.return_value = {
+        "daily_metrics": {"total_time": 100, "active_time": 80, "idle_time": 20},
+        "app_patterns": {},
+        "insights": {},
+        "activities": [
+            {"start_time": day.replace(hour=9), "active_time": 30},
+            {"start_time": day.replace(hour=9, minute=45), "active_time": 15},
+            {"start_time": day.replace(hour=14), "active_time": 0},
+        ],
+    }
+
+    hourly = manager.get_productivity_data(timedelta(days=1))["hourly_distribution"]
+
+    assert list(hourly) == list(range(24))
+    assert hourly[9] == 45.0
+    assert sum(hourly.values()) == 45.0
+
+
+def test_failed_report_leaves_shared_fallback_intact(manager, services):
+    """Test repeated failures return equal results from the fallback."""
+    services.analytics.get_productivity_report.side_effect = RuntimeError("down")
+
+    first = manager.get_productivity_data(timedelta(days=1))
+    first["metrics"]["total_time"] = 999
+    first["hourly_distribution"][0] = 999
+    second = manager.get_productivity_data(timedelta(days=1))
+
+    assert second["metrics"]["total_time"] == 0
+    assert second["hourly_distribution"] == dict.fromkeys(range(24), 0.0)
+    assert second["statistics"]["app_count"] == 0
+    assert services.analytics.get_productivity_report.call_count == 6
+
+
+def test_get_dashboard_data_collects_all_sections(manager, services):
+    """Test the dashboard payload combines the concurrent queries."""
+    services.session.repository.get_by_timerange.return_value = []
+    services.analytics.get_productivity_report.return_value = {}
+    services.suggestion.get_current_suggestions.side_effect = RuntimeError("down")
+
+    data = manager.get_dashboard_data(timedelta(days=1))
+
+    assert data["activities"] == {
+        "list": [],
+        "total_active_time": 0,
+        "total_idle_time": 0,
+        "total_time": 0,
+    }
+    assert data["productivity"] == manager._get_empty_metrics()
+    assert data["suggestions"] == []
+
+
+def test_workspace_close_details_closes_each_name_once(manager):
+    """Test repeated executables report failure after the first close."""
+    controller = MagicMock()
+    controller.list_running_apps.return_value = [
+        SimpleNamespace(name=name, exe=f"C:\\{name}", cmdline=[name], window_title="")
+        for name in ("a.exe", "b.exe", "a.exe", None)
+    ]
+    controller.close_app_by_exe.side_effect = lambda name: name == "a.exe"
+    manager._workspace_service = SimpleNamespace(controller=controller)
+
+    details = manager.workspace_close_details()["apps"]
+
+    assert [d["result"] for d in details] == ["closed", "failed", "failed", "failed"]
+    assert sorted(c.args[0] for c in controller.close_app_by_exe.call_args_list) == [
+        "a.exe",
+        "b.exe",
+    ]
+
+
+def test_close_stops_worker_threads(manager, services):
+    """Test close() shuts down the shared executor."""
+    services.session.repository.get_by_timerange.return_value = []
+    manager.get_dashboard_data(timedelta(days=1))
+
+    manager.close()
+
+    with pytest.raises(RuntimeError):
+        manager._executor.submit(int)
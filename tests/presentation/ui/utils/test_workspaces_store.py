@@ -0,0 +1,116 @@
+"""Tests for the named WorkspacesStore."""
+
+import json
+import os
+
+import pytest
+
+from src.presentation.ui.utils import json_io
+from src.presentation.ui.utils.workspaces_store import WorkspacesStore
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Create a workspaces store in an empty directory."""
+    return WorkspacesStore(base_dir=os.path.join(temp_dir, "workspaces"))
+
+
+def _apps():
+    return [{"executable": "code.exe", "args": ["--new-window"], "title": "Editor"}]
+
+
+def _read_file(store):
+    with open(os.path.join(store.base_dir, "workspaces.json"), "rb") as f:
+        return json_io.loads(f.read())
+
+
+def test_save_new_persists_atomically(store):
+    """Test a saved workspace is on disk with no temp file left behind."""
+    rec = store.save_new("Coding", _apps())
+
+    assert [w["id"] for w in _read_file(store)["workspaces"]] == [rec.id]
+    assert os.listdir(store.base_dir) == ["workspaces.json"]
+
+
+def test_list_reflects_external_edits(store):
+    """Test the cached rows are dropped when the file changes on disk."""
+    store.save_new("Coding", _apps())
+    data = _read_file(store)
+    data["workspaces"][0]["name"] = "Renamed elsewhere"
+    with open(os.path.join(store.base_dir, "workspaces.json"), "w") as f:
+        json.dump(data, f)
+
+    assert [w.name for w in store.list()] == ["Renamed elsewhere"]
+
+
+def test_get_returns_independent_copy(store):
+    """Test mutating a fetched record does not touch the store."""
+    rec = store.save_new("Coding", _apps())
+
+    fetched = store.get(rec.id)
+    fetched.apps[0]["args"].append("--extra")
+    fetched.name = "Changed"
+
+    assert store.get(rec.id).apps == _apps()
+    assert store.list()[0].name == "Coding"
+
+
+def test_update_copies_on_write(store):
+    """Test update leaves records from earlier list() calls unchanged."""
+    rec = store.save_new("Coding", _apps())
+    listed = store.list()
+
+    updated = store.update(rec.id, name="Writing", favorite=True)
+
+    assert updated.name == "Writing" and updated.favorite
+    assert listed[0].name == "Coding" and not listed[0].favorite
+    assert store.get(rec.id).name == "Writing"
+    assert store.update("missing", name="x") is None
+
+
+def test_delete_and_duplicate(store):
+    """Test duplicating copies apps and deleting removes only one record."""
+    rec = store.save_new("Coding", _apps(), template=True)
+    dup = store.duplicate(rec.id, "Coding copy")
+
+    assert dup.template and dup.apps == rec.apps and dup.id != rec.id
+    assert store.delete(rec.id)
+    assert not store.delete(rec.id)
+    assert [w.id for w in store.list()] == [dup.id]
+
+
+def test_find_by_name_ignores_case_and_non_string_names(store):
+    """Test name lookups tolerate rows whose name is not a string."""
+    rec = store.save_new("Coding", _apps())
+    nameless = store.save_new(None, [])
+
+    assert store.find_by_name("  coding ").id == rec.id
+    assert store.find_by_name("None") is None
+    assert [w.id for w in store.list()] == [rec.id, nameless.id]
+
+
+def test_identical_write_is_skipped(store, monkeypatch):
+    """Test rewriting the same workspaces does not touch the file."""
+    store.save_new("Coding", _apps())
+    export_path = os.path.join(store.base_dir, "export.json")
+    store.export_to(export_path)
+    store.import_from(export_path, merge=False)
+
+    calls = []
+    monkeypatch.setattr(json_io, "atomic_write", lambda *args: calls.append(args))
+    assert store.import_from(export_path, merge=False) == 1
+    assert calls == []
+
+
+def test_failed_write_keeps_previous_rows(store, monkeypatch):
+    """Test a write error on a read-only directory leaves the cache intact."""
+    rec = store.save_new("Coding", _apps())
+
+    def failing_write(path, data):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(json_io, "atomic_write", failing_write)
+
+    with pytest.raises(PermissionError):
+        store.save_new("Writing", [])
+    assert [w.id for w in store.list()] == [rec.id]